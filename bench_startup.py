@@ -0,0 +1,62 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+PROGRAM = os.path.join(os.path.dirname(os.path.abspath(__file__)), "program.py")
+
+def measure(command, runs):
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Mierzy czas zimnego startu 'python program.py in.json out.yaml'.",
+    )
+    parser.add_argument("-n", "--runs", type=int, default=20, help="Liczba powtórzeń każdego pomiaru.")
+    parser.add_argument("--json", dest="json_path", help="Zapisz wyniki również do pliku JSON.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        input_path = os.path.join(tmp, "in.json")
+        output_path = os.path.join(tmp, "out.yaml")
+        with open(input_path, 'w', encoding='utf-8') as f:
+            json.dump({"name": "Produkt A", "price": 29.99, "tags": ["elektronika", "nowosc"]}, f)
+
+        cases = {
+            "python -c pass": [sys.executable, "-c", "pass"],
+            "import program": [sys.executable, "-c", f"import sys; sys.path.insert(0, {os.path.dirname(PROGRAM)!r}); import program"],
+            "program.py in.json out.yaml": [sys.executable, PROGRAM, input_path, output_path],
+        }
+        for command in cases.values():
+            measure(command, 1)
+
+        results = {}
+        print(f"{'Pomiar':<32}{'min [ms]':>10}{'mediana [ms]':>14}{'max [ms]':>10}")
+        for name, command in cases.items():
+            timings = measure(command, args.runs)
+            results[name] = {
+                "runs": args.runs,
+                "min_ms": min(timings) * 1000,
+                "median_ms": statistics.median(timings) * 1000,
+                "max_ms": max(timings) * 1000,
+            }
+            print(f"{name:<32}{results[name]['min_ms']:>10.1f}{results[name]['median_ms']:>14.1f}{results[name]['max_ms']:>10.1f}")
+
+    overhead = results["program.py in.json out.yaml"]["median_ms"] - results["python -c pass"]["median_ms"]
+    print(f"\nNarzut programu ponad start interpretera (mediana): {overhead:.1f} ms")
+
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=4, ensure_ascii=False)
+
+if __name__ == '__main__':
+    main()
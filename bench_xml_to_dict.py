@@ -0,0 +1,117 @@
+import argparse
+import gc
+import json
+import os
+import statistics
+import sys
+import time
+import xml.etree.ElementTree as ET
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from program import convert_xml_to_dict
+
+def convert_xml_to_dict_recursive(element):
+    result = {}
+
+    if element.attrib:
+        result.update(element.attrib)
+
+    for child in element:
+        child_data = convert_xml_to_dict_recursive(child)
+        if child.tag in result:
+            if not isinstance(result[child.tag], list):
+                result[child.tag] = [result[child.tag]]
+            result[child.tag].append(child_data)
+        else:
+            result[child.tag] = child_data
+
+    if element.text and element.text.strip():
+        text_content = element.text.strip()
+        if not result and not element.attrib:
+            return text_content
+        elif text_content:
+            result['#text'] = text_content
+
+    return result
+
+def build_deep_tree(depth, repeat):
+    root = ET.Element('root')
+    for index in range(repeat):
+        elem = ET.SubElement(root, 'item', id=str(index))
+        for level in range(depth):
+            elem = ET.SubElement(elem, 'level')
+            if level % 3 == 0:
+                elem.text = f"poziom {level}"
+        elem.text = str(index)
+    return root
+
+def build_wide_tree(items, fields):
+    root = ET.Element('root')
+    for index in range(items):
+        item = ET.SubElement(root, 'item', id=str(index))
+        for field in range(fields):
+            child = ET.SubElement(item, f"field_{field % (fields // 2 or 1)}")
+            child.text = f"wartosc {index}-{field}"
+        ET.SubElement(item, 'tag').text = 'elektronika'
+        ET.SubElement(item, 'tag').text = 'nowosc'
+    return root
+
+def measure(func, root, runs):
+    timings = []
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(runs):
+            start = time.perf_counter()
+            func(root)
+            timings.append(time.perf_counter() - start)
+    finally:
+        gc.enable()
+    return statistics.median(timings)
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Porównuje iteracyjną i rekurencyjną konwersję XML na słownik na głębokich i szerokich drzewach.",
+    )
+    parser.add_argument("-n", "--runs", type=int, default=5, help="Liczba powtórzeń każdego pomiaru.")
+    parser.add_argument("--depth", type=int, default=500, help="Głębokość zagnieżdżenia drzewa 'deep'.")
+    parser.add_argument("--json", dest="json_path", help="Zapisz wyniki również do pliku JSON.")
+    args = parser.parse_args()
+
+    cases = {
+        f"deep ({args.depth} poziomów)": build_deep_tree(args.depth, 200),
+        "wide (20000 x 20 pól)": build_wide_tree(20000, 20),
+        "very deep (100000 poziomów)": build_deep_tree(100000, 1),
+    }
+
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), args.depth + 100))
+    results = {}
+    print(f"{'Drzewo':<30}{'rekurencyjnie [ms]':>20}{'iteracyjnie [ms]':>18}{'przyspieszenie':>16}")
+    for name, root in cases.items():
+        try:
+            expected = convert_xml_to_dict_recursive(root)
+        except RecursionError:
+            expected = None
+        if expected is not None and convert_xml_to_dict(root) != expected:
+            print(f"{name:<30}BŁĄD: wyniki obu wersji się różnią.")
+            return 1
+        iterative = measure(convert_xml_to_dict, root, args.runs)
+        recursive = measure(convert_xml_to_dict_recursive, root, args.runs) if expected is not None else None
+        results[name] = {
+            "recursive_ms": recursive * 1000 if recursive is not None else None,
+            "iterative_ms": iterative * 1000,
+            "speedup": recursive / iterative if recursive is not None else None,
+        }
+        if recursive is None:
+            print(f"{name:<30}{'RecursionError':>20}{iterative * 1000:>18.1f}{'-':>16}")
+        else:
+            print(f"{name:<30}{recursive * 1000:>20.1f}{iterative * 1000:>18.1f}{recursive / iterative:>15.2f}x")
+
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=4, ensure_ascii=False)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,633 @@
+import concurrent.futures
+import multiprocessing
+import os
+import sys
+import time
+
+from PyQt6.QtWidgets import (
+    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
+    QLineEdit, QPushButton, QComboBox, QFileDialog, QMessageBox, QPlainTextEdit, QCheckBox, QProgressBar,
+    QTabWidget, QTableView, QHeaderView, QSpinBox
+)
+from PyQt6.QtCore import Qt, QThread, QTimer, QAbstractTableModel, QModelIndex, pyqtSignal
+
+from program import (
+    FORMATS,
+    ConversionCancelled,
+    _format_size,
+    build_batch_jobs,
+    convert,
+    convert_job,
+    format_from_path,
+    format_names,
+    get_format,
+    stream_required,
+)
+
+LOG_FLUSH_INTERVAL_MS = 50
+LOG_MAX_LINES = 5000
+BATCH_REFRESH_INTERVAL_MS = 200
+BATCH_POOLS = {
+    'Procesy': lambda workers: concurrent.futures.ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context('spawn')
+    ),
+    'Wątki': lambda workers: concurrent.futures.ThreadPoolExecutor(max_workers=workers),
+}
+
+class ConverterWorker(QThread):
+    finished = pyqtSignal(bool, str) 
+    progress = pyqtSignal(str) 
+    transfer = pyqtSignal(int, float, float, float)
+
+    def __init__(self, input_path, input_format, output_path, output_format, trace_memory=False):
+        super().__init__()
+        self.input_path = input_path
+        self.input_format = input_format
+        self.output_path = output_path
+        self.output_format = output_format
+        self.trace_memory = trace_memory
+        self.started_at = None
+
+    def report_transfer(self, bytes_read, total, bytes_written):
+        elapsed = time.perf_counter() - self.started_at
+        rate = bytes_read / elapsed if elapsed > 0 else 0.0
+        if total:
+            percent = min(100, bytes_read * 100 // total)
+            eta = (total - bytes_read) / rate if rate > 0 else -1.0
+        else:
+            percent = -1
+            eta = -1.0
+        self.transfer.emit(percent, rate, eta, float(bytes_written))
+
+    def run(self):
+        try:
+            self.progress.emit("Rozpoczynanie konwersji w tle...")
+            input_spec = get_format(self.input_format)
+            output_spec = get_format(self.output_format)
+            for spec in (input_spec, output_spec):
+                engine = spec.backend('engine')
+                if engine is not None:
+                    self.progress.emit(f"  Silnik {spec.label}: {engine()}")
+            if stream_required(input_spec.name, output_spec.name):
+                self.progress.emit("  Konwersja strumieniowa rekord po rekordzie...")
+
+            self.started_at = time.perf_counter()
+            result = convert(
+                self.input_path,
+                self.output_path,
+                input_format=self.input_format,
+                output_format=self.output_format,
+                trace_memory=self.trace_memory,
+                progress=self.report_transfer,
+                cancelled=self.isInterruptionRequested
+            )
+            self.progress.emit(result.summary())
+            self.finished.emit(True, "Konwersja zakończona pomyślnie!")
+
+        except ConversionCancelled:
+            self.progress.emit(f"Usunięto częściowy plik wyjściowy '{self.output_path}'.")
+            self.finished.emit(False, "Konwersja została anulowana.")
+        except Exception as e:
+            import traceback
+            error_details = traceback.format_exc()
+            self.progress.emit(f"BŁĄD WĄTKU KONWERSJI: {e}\n{error_details}")
+            self.finished.emit(False, f"Wystąpił błąd podczas konwersji: {e}")
+
+class BatchJobModel(QAbstractTableModel):
+    COLUMNS = ['Plik wejściowy', 'Plik wyjściowy', 'Status', 'Czas [s]', 'Rozmiar', 'Przepustowość']
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.rows = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.COLUMNS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self.rows[index.row()]
+        if role == Qt.ItemDataRole.ToolTipRole and row['error']:
+            return row['error']
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        column = index.column()
+        if column == 0:
+            return row['input_path']
+        if column == 1:
+            return row['output_path'] or ""
+        if column == 2:
+            return f"błąd: {row['error']}" if row['error'] else row['status']
+        if column == 3:
+            if row['seconds'] is not None:
+                return f"{row['seconds']:.3f}"
+            if row['started'] is not None:
+                return f"{time.perf_counter() - row['started']:.1f}"
+            return ""
+        if column == 4:
+            return _format_size(row['bytes_in']) if row['bytes_in'] is not None else ""
+        if column == 5:
+            if row['status'] == "zakończono" and row['seconds'] and row['bytes_in']:
+                return f"{row['bytes_in'] / row['seconds'] / (1024 * 1024):.2f} MB/s"
+            return ""
+        return None
+
+    def add_files(self, paths):
+        known = set(row['input_path'] for row in self.rows)
+        paths = [path for path in paths if path not in known]
+        if not paths:
+            return 0
+        self.beginInsertRows(QModelIndex(), len(self.rows), len(self.rows) + len(paths) - 1)
+        for path in paths:
+            self.rows.append({
+                "input_path": path,
+                "output_path": None,
+                "status": "nowe",
+                "started": None,
+                "seconds": None,
+                "bytes_in": os.path.getsize(path),
+                "bytes_out": None,
+                "error": None
+            })
+        self.endInsertRows()
+        return len(paths)
+
+    def update_row(self, row, **values):
+        self.rows[row].update(values)
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.COLUMNS) - 1))
+
+    def refresh_running(self):
+        for row, values in enumerate(self.rows):
+            if values['status'] == "w toku":
+                self.dataChanged.emit(self.index(row, 3), self.index(row, 3))
+
+    def remove_finished(self):
+        self.beginResetModel()
+        self.rows = [row for row in self.rows if row['status'] in ("nowe", "w kolejce", "w toku")]
+        self.endResetModel()
+
+class BatchPanel(QWidget):
+    job_done = pyqtSignal(int, object)
+
+    def __init__(self):
+        super().__init__()
+        self.executor = None
+        self.futures = {}
+        self.batch_started = None
+        self.batch_finished = None
+        self.init_ui()
+
+    def init_ui(self):
+        self.setAcceptDrops(True)
+        main_layout = QVBoxLayout()
+
+        files_layout = QHBoxLayout()
+        self.add_files_btn = QPushButton('Dodaj pliki...')
+        self.add_files_btn.clicked.connect(self.browse_input_files)
+        self.add_dir_btn = QPushButton('Dodaj folder...')
+        self.add_dir_btn.clicked.connect(self.browse_input_dir)
+        self.clear_btn = QPushButton('Usuń zakończone')
+        self.clear_btn.clicked.connect(self.remove_finished)
+        files_layout.addWidget(QLabel('Przeciągnij pliki lub foldery na tabelę albo:'))
+        files_layout.addWidget(self.add_files_btn)
+        files_layout.addWidget(self.add_dir_btn)
+        files_layout.addWidget(self.clear_btn)
+        main_layout.addLayout(files_layout)
+
+        output_layout = QHBoxLayout()
+        self.output_dir_edit = QLineEdit()
+        self.output_dir_edit.setPlaceholderText("Wybierz folder wyjściowy...")
+        self.output_dir_btn = QPushButton('Przeglądaj...')
+        self.output_dir_btn.clicked.connect(self.browse_output_dir)
+        self.output_format_combo = QComboBox()
+        self.output_format_combo.addItems(format_names())
+        output_layout.addWidget(QLabel('Folder wyjściowy:'))
+        output_layout.addWidget(self.output_dir_edit)
+        output_layout.addWidget(self.output_dir_btn)
+        output_layout.addWidget(QLabel('Format wyjściowy:'))
+        output_layout.addWidget(self.output_format_combo)
+        main_layout.addLayout(output_layout)
+
+        pool_layout = QHBoxLayout()
+        self.pool_combo = QComboBox()
+        self.pool_combo.addItems(list(BATCH_POOLS))
+        self.workers_spin = QSpinBox()
+        self.workers_spin.setRange(1, 64)
+        self.workers_spin.setValue(os.cpu_count() or 1)
+        pool_layout.addWidget(QLabel('Pula:'))
+        pool_layout.addWidget(self.pool_combo)
+        pool_layout.addWidget(QLabel('Liczba zadań równolegle:'))
+        pool_layout.addWidget(self.workers_spin)
+        pool_layout.addStretch()
+        main_layout.addLayout(pool_layout)
+
+        self.model = BatchJobModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        self.table.horizontalHeader().setStretchLastSection(True)
+        main_layout.addWidget(self.table)
+
+        self.summary_label = QLabel("Kolejka jest pusta.")
+        main_layout.addWidget(self.summary_label)
+
+        buttons_layout = QHBoxLayout()
+        self.start_btn = QPushButton('Konwertuj kolejkę')
+        self.start_btn.setFixedHeight(40)
+        self.start_btn.setStyleSheet("background-color: #4CAF50; color: white; font-weight: bold;")
+        self.start_btn.clicked.connect(self.start_batch)
+        self.stop_btn = QPushButton('Zatrzymaj')
+        self.stop_btn.setFixedHeight(40)
+        self.stop_btn.setEnabled(False)
+        self.stop_btn.clicked.connect(self.stop_batch)
+        buttons_layout.addWidget(self.start_btn)
+        buttons_layout.addWidget(self.stop_btn)
+        main_layout.addLayout(buttons_layout)
+
+        self.setLayout(main_layout)
+
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setInterval(BATCH_REFRESH_INTERVAL_MS)
+        self.refresh_timer.timeout.connect(self.refresh_status)
+        self.job_done.connect(self.on_job_done)
+
+    def dragEnterEvent(self, event):
+        if event.mimeData().hasUrls():
+            event.acceptProposedAction()
+
+    def dropEvent(self, event):
+        self.add_paths([url.toLocalFile() for url in event.mimeData().urls() if url.isLocalFile()])
+        event.acceptProposedAction()
+
+    def browse_input_files(self):
+        file_names, _ = QFileDialog.getOpenFileNames(self, "Wybierz pliki wejściowe", "")
+        self.add_paths(file_names)
+
+    def browse_input_dir(self):
+        dir_name = QFileDialog.getExistingDirectory(self, "Wybierz folder z plikami wejściowymi")
+        if dir_name:
+            self.add_paths([dir_name])
+
+    def browse_output_dir(self):
+        dir_name = QFileDialog.getExistingDirectory(self, "Wybierz folder wyjściowy")
+        if dir_name:
+            self.output_dir_edit.setText(dir_name)
+
+    def add_paths(self, paths):
+        files = []
+        for path in paths:
+            if os.path.isdir(path):
+                for dirpath, dirnames, filenames in os.walk(path):
+                    dirnames.sort()
+                    files.extend(os.path.join(dirpath, name) for name in sorted(filenames))
+            elif os.path.isfile(path):
+                files.append(path)
+        supported = [path for path in files if format_from_path(path)]
+        added = self.model.add_files(supported)
+        skipped = len(files) - len(supported)
+        message = f"Dodano plików: {added}."
+        if skipped:
+            message += f" Pominięto plików o nieznanym formacie: {skipped}."
+        self.summary_label.setText(message)
+
+    def remove_finished(self):
+        self.model.remove_finished()
+        self.summary_label.setText(f"Plików w kolejce: {len(self.model.rows)}.")
+
+    def start_batch(self):
+        output_dir = self.output_dir_edit.text()
+        if not output_dir:
+            QMessageBox.warning(self, "Błąd", "Proszę wybrać folder wyjściowy.")
+            return
+        rows = [row for row, values in enumerate(self.model.rows) if values['status'] == "nowe"]
+        if not rows:
+            QMessageBox.information(self, "Kolejka", "Brak nowych plików do konwersji.")
+            return
+
+        jobs = build_batch_jobs({
+            "inputs": [(self.model.rows[row]['input_path'], os.path.basename(self.model.rows[row]['input_path']))
+                       for row in rows],
+            "output_format": self.output_format_combo.currentText(),
+            "output_dir": output_dir,
+            "stream": False,
+            "yaml_documents": False,
+            "stats": None
+        })
+        output_paths = set(
+            os.path.normcase(values['output_path'])
+            for values in self.model.rows if values['output_path'] and values['status'] != "nowe"
+        )
+        workers = self.workers_spin.value()
+        self.executor = BATCH_POOLS[self.pool_combo.currentText()](workers)
+        self.batch_started = time.perf_counter()
+        self.batch_finished = None
+        for row, job in zip(rows, jobs):
+            output_key = os.path.normcase(job['output_path'])
+            if output_key in output_paths:
+                self.model.update_row(row, output_path=job['output_path'], status="błąd",
+                                      error="plik wyjściowy powtarza się w kolejce")
+                continue
+            output_paths.add(output_key)
+            self.model.update_row(row, output_path=job['output_path'], status="w kolejce")
+            self.futures[row] = self.executor.submit(convert_job, job)
+
+        if not self.futures:
+            self.finish_batch()
+            return
+        self.start_btn.setEnabled(False)
+        self.stop_btn.setEnabled(True)
+        self.clear_btn.setEnabled(False)
+        self.refresh_timer.start()
+        self.refresh_status()
+        for row, future in list(self.futures.items()):
+            future.add_done_callback(lambda future, row=row: self.job_done.emit(row, future))
+
+    def stop_batch(self):
+        for future in list(self.futures.values()):
+            future.cancel()
+        self.stop_btn.setEnabled(False)
+
+    def refresh_status(self):
+        for row, future in self.futures.items():
+            if self.model.rows[row]['status'] == "w kolejce" and future.running():
+                self.model.update_row(row, status="w toku", started=time.perf_counter())
+        self.model.refresh_running()
+        self.summary_label.setText(self.summary())
+
+    def on_job_done(self, row, future):
+        if self.futures.pop(row, None) is None:
+            return
+        if future.cancelled():
+            self.model.update_row(row, status="anulowano", started=None)
+        else:
+            try:
+                result = future.result()
+            except Exception as e:
+                result = {"success": False, "seconds": None, "bytes_in": None, "bytes_out": 0, "error": str(e)}
+            self.model.update_row(
+                row,
+                status="zakończono" if result['success'] else "błąd",
+                started=None,
+                seconds=result['seconds'],
+                bytes_in=result['bytes_in'] if result['bytes_in'] is not None else self.model.rows[row]['bytes_in'],
+                bytes_out=result['bytes_out'],
+                error=result['error']
+            )
+        if not self.futures:
+            self.finish_batch()
+        else:
+            self.summary_label.setText(self.summary())
+
+    def finish_batch(self):
+        self.batch_finished = time.perf_counter()
+        self.refresh_timer.stop()
+        if self.executor is not None:
+            self.executor.shutdown(wait=False)
+            self.executor = None
+        self.start_btn.setEnabled(True)
+        self.stop_btn.setEnabled(False)
+        self.clear_btn.setEnabled(True)
+        self.summary_label.setText(self.summary())
+
+    def summary(self):
+        counts = {}
+        for values in self.model.rows:
+            counts[values['status']] = counts.get(values['status'], 0) + 1
+        parts = [f"{status}: {count}" for status, count in counts.items()]
+        if self.batch_started is not None:
+            elapsed = (self.batch_finished or time.perf_counter()) - self.batch_started
+            done_bytes = sum(values['bytes_in'] or 0 for values in self.model.rows if values['status'] == "zakończono")
+            parts.append(f"czas {elapsed:.1f} s")
+            if elapsed:
+                parts.append(f"przepustowość {done_bytes / elapsed / (1024 * 1024):.2f} MB/s")
+        return " | ".join(parts) if parts else "Kolejka jest pusta."
+
+class DataConverterApp(QWidget):
+    def __init__(self):
+        super().__init__()
+        self.init_ui()
+
+    def init_ui(self):
+        self.setWindowTitle('Konwerter Danych (XML, JSON, JSON Lines, YAML)')
+        self.setGeometry(100, 100, 900, 550)
+
+        main_layout = QVBoxLayout()
+
+        input_layout = QHBoxLayout()
+        self.input_label = QLabel('Plik wejściowy:')
+        self.input_path_edit = QLineEdit()
+        self.input_path_edit.setPlaceholderText("Wybierz plik wejściowy...")
+        self.input_browse_btn = QPushButton('Przeglądaj...')
+        self.input_browse_btn.clicked.connect(self.browse_input_file)
+        self.input_format_label = QLabel('Format wejściowy:')
+        self.input_format_combo = QComboBox()
+        self.input_format_combo.addItems(format_names())
+
+        input_layout.addWidget(self.input_label)
+        input_layout.addWidget(self.input_path_edit)
+        input_layout.addWidget(self.input_browse_btn)
+        input_layout.addWidget(self.input_format_label)
+        input_layout.addWidget(self.input_format_combo)
+        main_layout.addLayout(input_layout)
+
+        output_layout = QHBoxLayout()
+        self.output_label = QLabel('Plik wyjściowy:')
+        self.output_path_edit = QLineEdit()
+        self.output_path_edit.setPlaceholderText("Wybierz lub wprowadź nazwę pliku wyjściowego...")
+        self.output_browse_btn = QPushButton('Przeglądaj...')
+        self.output_browse_btn.clicked.connect(self.browse_output_file)
+        self.output_format_label = QLabel('Format wyjściowy:')
+        self.output_format_combo = QComboBox()
+        self.output_format_combo.addItems(format_names())
+
+        output_layout.addWidget(self.output_label)
+        output_layout.addWidget(self.output_path_edit)
+        output_layout.addWidget(self.output_browse_btn)
+        output_layout.addWidget(self.output_format_label)
+        output_layout.addWidget(self.output_format_combo)
+        main_layout.addLayout(output_layout)
+
+        self.memory_stats_check = QCheckBox('Mierz szczytowe zużycie pamięci (tracemalloc, wolniej)')
+        main_layout.addWidget(self.memory_stats_check)
+
+        self.convert_btn = QPushButton('Konwertuj')
+        self.convert_btn.setFixedHeight(40)
+        self.convert_btn.setStyleSheet("background-color: #4CAF50; color: white; font-weight: bold;")
+        self.convert_btn.clicked.connect(self.perform_conversion)
+        self.cancel_btn = QPushButton('Anuluj')
+        self.cancel_btn.setFixedHeight(40)
+        self.cancel_btn.setEnabled(False)
+        self.cancel_btn.clicked.connect(self.cancel_conversion)
+        buttons_layout = QHBoxLayout()
+        buttons_layout.addWidget(self.convert_btn)
+        buttons_layout.addWidget(self.cancel_btn)
+        main_layout.addLayout(buttons_layout)
+
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.setValue(0)
+        self.transfer_label = QLabel("")
+        main_layout.addWidget(self.progress_bar)
+        main_layout.addWidget(self.transfer_label)
+
+        self.log_output = QPlainTextEdit()
+        self.log_output.setReadOnly(True)
+        self.log_output.setMaximumBlockCount(LOG_MAX_LINES)
+        self.log_output.setStyleSheet("background-color: #f0f0f0; border: 1px solid #ccc;")
+        main_layout.addWidget(QLabel("Logi operacji:"))
+        main_layout.addWidget(self.log_output)
+
+        single_tab = QWidget()
+        single_tab.setLayout(main_layout)
+        self.batch_panel = BatchPanel()
+        self.tabs = QTabWidget()
+        self.tabs.addTab(single_tab, 'Pojedynczy plik')
+        self.tabs.addTab(self.batch_panel, 'Kolejka wsadowa')
+        window_layout = QVBoxLayout()
+        window_layout.addWidget(self.tabs)
+        self.setLayout(window_layout)
+
+        self.log_buffer = []
+        self.log_timer = QTimer(self)
+        self.log_timer.setInterval(LOG_FLUSH_INTERVAL_MS)
+        self.log_timer.setSingleShot(True)
+        self.log_timer.timeout.connect(self.flush_log)
+
+        self.input_path_edit.textChanged.connect(self.update_input_format)
+
+        self.output_path_edit.textChanged.connect(self.update_output_format)
+
+    def update_input_format(self):
+        file_format = format_from_path(self.input_path_edit.text())
+        index = self.input_format_combo.findText(file_format) if file_format else -1
+        if index >= 0:
+            self.input_format_combo.setCurrentIndex(index)
+
+    def update_output_format(self):
+        file_format = format_from_path(self.output_path_edit.text())
+        index = self.output_format_combo.findText(file_format) if file_format else -1
+        if index >= 0:
+            self.output_format_combo.setCurrentIndex(index)
+
+    def file_filter(self):
+        filters = ["Wszystkie pliki (*)"]
+        for spec in FORMATS.values():
+            patterns = " ".join(f"*.{extension}" for extension in spec.extensions)
+            filters.append(f"{spec.label} pliki ({patterns})")
+        return ";;".join(filters)
+
+    def browse_input_file(self):
+        file_name, _ = QFileDialog.getOpenFileName(self, "Wybierz plik wejściowy", "", self.file_filter())
+        if file_name:
+            self.input_path_edit.setText(file_name)
+
+    def browse_output_file(self):
+        file_name, _ = QFileDialog.getSaveFileName(self, "Zapisz plik wyjściowy jako", "", self.file_filter())
+        if file_name:
+            self.output_path_edit.setText(file_name)
+
+    def log_message(self, message):
+        self.log_buffer.append(message)
+        if not self.log_timer.isActive():
+            self.log_timer.start()
+
+    def flush_log(self):
+        self.log_timer.stop()
+        if not self.log_buffer:
+            return
+        lines = "\n".join(self.log_buffer).splitlines()
+        self.log_buffer.clear()
+        self.log_output.appendPlainText("\n".join(lines[-LOG_MAX_LINES:]))
+
+    def clear_log(self):
+        self.log_timer.stop()
+        self.log_buffer.clear()
+        self.log_output.clear()
+
+    def perform_conversion(self):
+        self.clear_log()
+        self.log_message("Rozpoczynanie konwersji...")
+
+        input_path = self.input_path_edit.text()
+        output_path = self.output_path_edit.text()
+        input_format = self.input_format_combo.currentText()
+        output_format = self.output_format_combo.currentText()
+
+        if not input_path or not output_path:
+            QMessageBox.warning(self, "Błąd", "Proszę podać ścieżki do obu plików (wejściowego i wyjściowego).")
+            self.log_message("Błąd: Nie podano wszystkich ścieżek.")
+            return
+
+        if not os.path.exists(input_path):
+            QMessageBox.warning(self, "Błąd", f"Plik wejściowy '{input_path}' nie istnieje.")
+            self.log_message(f"Błąd: Plik wejściowy '{input_path}' nie istnieje.")
+            return
+
+        self.log_message(f"  Plik wejściowy: {input_path} (Format: {input_format})")
+        self.log_message(f"  Plik wyjściowy: {output_path} (Format: {output_format})")
+
+    
+        self.convert_btn.setEnabled(False)
+        self.convert_btn.setText("Konwertuję...")
+        self.cancel_btn.setEnabled(True)
+        self.cancel_btn.setText("Anuluj")
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.setValue(0)
+        self.transfer_label.setText("")
+
+        self.worker = ConverterWorker(input_path, input_format, output_path, output_format,
+                                      trace_memory=self.memory_stats_check.isChecked())
+        self.worker.finished.connect(self.on_conversion_finished)
+        self.worker.progress.connect(self.log_message) 
+        self.worker.transfer.connect(self.on_transfer)
+        self.worker.start() 
+
+    def cancel_conversion(self):
+        self.worker.requestInterruption()
+        self.cancel_btn.setEnabled(False)
+        self.cancel_btn.setText("Anulowanie...")
+        self.log_message("Anulowanie konwersji...")
+
+    def on_transfer(self, percent, bytes_per_second, eta_seconds, bytes_written):
+        parts = []
+        if percent < 0:
+            self.progress_bar.setRange(0, 0)
+        else:
+            self.progress_bar.setValue(percent)
+            parts.append(f"{percent}%")
+        parts.append(f"{_format_size(bytes_per_second)}/s")
+        if eta_seconds >= 0:
+            parts.append(f"pozostało ok. {eta_seconds:.0f} s")
+        if bytes_written:
+            parts.append(f"zapisano {_format_size(bytes_written)}")
+        self.transfer_label.setText(" | ".join(parts))
+
+    def on_conversion_finished(self, success, message):
+        self.convert_btn.setEnabled(True) 
+        self.convert_btn.setText("Konwertuj")
+        self.cancel_btn.setEnabled(False)
+        self.cancel_btn.setText("Anuluj")
+        self.progress_bar.setRange(0, 100)
+        if success:
+            self.progress_bar.setValue(100)
+
+        self.log_message(message)
+        self.flush_log()
+        if success:
+            QMessageBox.information(self, "Sukces", message)
+        else:
+            QMessageBox.critical(self, "Błąd Konwersji", message)
+
+def run_gui():
+    app = QApplication(sys.argv)
+    window = DataConverterApp()
+    window.show()
+    return app.exec()
@@ -1,38 +1,313 @@
 import argparse
+import codecs
+import contextlib
+import hashlib
+import io
 import os
 import json
+import re
+import shutil
+import time
 import xml.etree.ElementTree as ET
-from xml.dom import minidom
-import yaml
 import sys 
 
-from PyQt6.QtWidgets import (
-    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-    QLineEdit, QPushButton, QComboBox, QFileDialog, QMessageBox, QTextEdit
-)
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
+WRITE_BUFFER_SIZE = 1024 * 1024
+READ_CHUNK_SIZE = 64 * 1024
+PARALLEL_SHARD_SIZE = 10000
+CONVERTER_VERSION = "2"
+CACHE_MAX_SIZE = 1024 ** 3
+CACHE_HASH_CHUNK_SIZE = 1024 * 1024
+MANIFEST_NAME = '.data-converter.manifest'
+WATCH_INTERVAL = 1.0
+WATCH_DEBOUNCE = 2.0
+
+def yaml_loader_class():
+    import yaml
+    return getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+def yaml_dumper_class():
+    import yaml
+    return getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+def yaml_backend_name():
+    import yaml
+    if hasattr(yaml, 'CSafeLoader'):
+        return "libyaml (C)"
+    return "czysty Python (brak libyaml)"
+
+class FileFormat:
+    BACKENDS = (
+        'reader', 'record_writer', 'stream_writer', 'loader', 'to_data', 'dumper', 'writer', 'sniffer', 'engine',
+        'run_frames'
+    )
+
+    def __init__(self, name, label, extensions):
+        self.name = name
+        self.label = label
+        self.extensions = tuple(extensions)
+        self.stream = False
+        self.writer_options = ()
+        self.shard_frames = None
+        self.content_type = 'application/octet-stream'
+        for role in self.BACKENDS:
+            setattr(self, role, None)
+
+    def backend(self, role):
+        value = getattr(self, role)
+        if isinstance(value, str):
+            import importlib
+            module_name, _, attribute = value.partition(':')
+            value = getattr(importlib.import_module(module_name), attribute)
+            setattr(self, role, value)
+        return value
+
+    def engine_suffix(self):
+        engine = self.backend('engine')
+        return f" (silnik: {engine()})" if engine is not None else ""
+
+FORMATS = {}
+DEFAULT_SNIFFED_FORMAT = 'yaml'
+SNIFF_SIZE = 4096
+
+def register_format(name, label=None, extensions=None, stream=None, writer_options=None, shard_frames=None,
+                    content_type=None, **backends):
+    file_format = FORMATS.get(name)
+    if file_format is None:
+        file_format = FORMATS[name] = FileFormat(name, label or name.upper(), extensions or (name,))
+    else:
+        if label is not None:
+            file_format.label = label
+        if extensions is not None:
+            file_format.extensions = tuple(extensions)
+    if stream is not None:
+        file_format.stream = stream
+    if writer_options is not None:
+        file_format.writer_options = tuple(writer_options)
+    if shard_frames is not None:
+        file_format.shard_frames = shard_frames
+    if content_type is not None:
+        file_format.content_type = content_type
+    for role, value in backends.items():
+        if role not in FileFormat.BACKENDS:
+            raise TypeError(f"Nieznany rodzaj funkcji formatu: '{role}'")
+        setattr(file_format, role, value)
+    return file_format
+
+def get_format(name):
+    file_format = FORMATS.get(normalize_format(name))
+    if file_format is None:
+        raise ValueError(f"Nieobsługiwany format: {name}")
+    return file_format
+
+def format_names():
+    return list(FORMATS)
+
+def format_extensions():
+    return [extension for file_format in FORMATS.values() for extension in file_format.extensions]
+
+def normalize_format(name):
+    if name is None:
+        return None
+    name = name.lower()
+    if name in FORMATS:
+        return name
+    for file_format in FORMATS.values():
+        if name in file_format.extensions:
+            return file_format.name
+    return None
+
+def format_from_path(path):
+    _, ext = os.path.splitext(path)
+    ext = ext[1:].lower()
+    for file_format in FORMATS.values():
+        if ext in file_format.extensions:
+            return file_format.name
+    return None
+
+def sniff_format(head):
+    head = head.lstrip(codecs.BOM_UTF8).lstrip()
+    for file_format in FORMATS.values():
+        sniffer = file_format.backend('sniffer')
+        if sniffer is not None and sniffer(head):
+            return file_format.name
+    return DEFAULT_SNIFFED_FORMAT
+
+def stream_required(*names):
+    return any(FORMATS[name].stream for name in names)
 
 def parse_arguments():
     parser = argparse.ArgumentParser(
-        description="Konwertuje dane z jednego formatu na inny (XML, JSON, YAML).",
+        description="Konwertuje dane z jednego formatu na inny (XML, JSON, JSON Lines, YAML).",
     )
 
     parser.add_argument(
-        "input_file",
+        "paths",
         type=str,
-        help="Ścieżka do pliku wejściowego (np. input.xml, data.json)."
+        nargs='+',
+        metavar="PLIK",
+        help="Ścieżka do pliku wejściowego i wyjściowego (np. input.xml output.json). "
+             "Z opcją --output-dir: dowolna liczba plików wejściowych, katalogów lub wzorców glob."
     )
 
     parser.add_argument(
-        "output_file",
+        "--output-dir",
         type=str,
-        help="Ścieżka do pliku wyjściowego (np. output.json, result.yaml)."
+        help="Katalog wyjściowy dla konwersji wsadowej wielu plików."
+    )
+
+    parser.add_argument(
+        "--to",
+        dest="target_format",
+        type=str.lower,
+        choices=format_names() + [ext for ext in format_extensions() if ext not in FORMATS],
+        help="Format docelowy w konwersji wsadowej (np. json, yaml)."
+    )
+
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Liczba procesów roboczych w konwersji wsadowej (domyślnie: liczba rdzeni)."
+    )
+
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Konwertuj strumieniowo, rekord po rekordzie, bez wczytywania całego pliku do pamięci. "
+             "W XML powtarzające się elementy podrzędne elementu głównego muszą występować bezpośrednio po sobie."
+    )
+
+    parser.add_argument(
+        "--yaml-documents",
+        action="store_true",
+        help="W trybie strumieniowym zapisuj każdy rekord jako osobny dokument YAML (---)."
+    )
+
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Dziel rekordy najwyższego poziomu (i elementy powtarzających się list z XML) na fragmenty i serializuj je "
+             "równolegle w --jobs procesach. Odczyt wejścia i budowa rekordów, w tym konwersja XML->dict, odbywają się "
+             "w procesie głównym; przyspieszany jest tylko zapis."
+    )
+
+    parser.add_argument(
+        "--shard-size",
+        type=int,
+        default=PARALLEL_SHARD_SIZE,
+        help=f"Liczba rekordów we fragmencie w trybie --parallel (domyślnie: {PARALLEL_SHARD_SIZE})."
+    )
+
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help=f"W konwersji wsadowej konwertuj tylko nieaktualne pliki: stan wejść (rozmiar, czas modyfikacji, SHA-256) "
+             f"i opcje każdego wyniku są zapisywane w pliku {MANIFEST_NAME} w katalogu wyjściowym."
+    )
+
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Używaj pamięci podręcznej wyników: identyczne wejście (skrót SHA-256), para formatów i opcje zapisu "
+             f"kopiują gotowy wynik zamiast konwersji. Domyślny katalog: {default_cache_dir()}."
+    )
+
+    parser.add_argument(
+        "--cache-dir",
+        metavar="KATALOG",
+        help="Katalog pamięci podręcznej (włącza --cache)."
+    )
+
+    parser.add_argument(
+        "--cache-size",
+        type=parse_size,
+        default=CACHE_MAX_SIZE,
+        metavar="ROZMIAR",
+        help="Limit rozmiaru pamięci podręcznej; najdawniej używane wpisy są usuwane (domyślnie: 1GB)."
+    )
+
+    parser.add_argument(
+        "--cache-link",
+        action="store_true",
+        help="Przy trafieniu twórz dowiązanie twarde zamiast kopii (plików wyjściowych nie wolno wtedy modyfikować w miejscu)."
+    )
+
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="Zbierz czasy etapów, rozmiary i szczytowe zużycie pamięci; raport JSON trafia na wyjście błędów "
+             "(stderr) albo do pliku z --stats-file."
+    )
+
+    parser.add_argument(
+        "--stats-file",
+        metavar="PLIK",
+        help="Zapisz raport JSON z --stats do PLIKU (włącza --stats)."
+    )
+
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Uruchom konwersję pod cProfile i zapisz PREFIKS.pstats oraz PREFIKS.collapsed (stosy dla flame graph). "
+             "Domyślny prefiks: ścieżka pliku wyjściowego z końcówką .profile."
+    )
+
+    parser.add_argument(
+        "--profile-prefix",
+        metavar="PREFIKS",
+        help="Prefiks plików profilu z --profile (włącza --profile)."
+    )
+
+    parser.add_argument(
+        "--profile-top",
+        type=int,
+        default=25,
+        metavar="N",
+        help="Liczba najkosztowniejszych funkcji w podsumowaniu profilu (domyślnie: 25)."
     )
 
     args = parser.parse_args() 
 
-    input_path = args.input_file
-    output_path = args.output_file
+    stats = (args.stats_file or '-') if args.stats or args.stats_file else None
+    if args.shard_size < 1:
+        parser.error("Błąd: Rozmiar fragmentu (--shard-size) musi być dodatni.")
+    cache = None
+    if args.cache or args.cache_dir:
+        cache = {"directory": args.cache_dir, "max_size": args.cache_size, "link": args.cache_link}
+    if args.output_dir is not None:
+        if args.parallel:
+            parser.error("Błąd: Tryb --parallel dotyczy pojedynczego pliku; konwersja wsadowa już działa równolegle.")
+        if args.profile or args.profile_prefix:
+            parser.error("Błąd: Profilowanie (--profile) działa tylko dla konwersji pojedynczego pliku.")
+        if not args.target_format:
+            parser.error("Błąd: Konwersja wsadowa wymaga podania formatu docelowego (--to).")
+        if args.jobs < 1:
+            parser.error("Błąd: Liczba procesów (--jobs) musi być dodatnia.")
+        try:
+            inputs = expand_input_paths(args.paths, skip_dir=args.output_dir)
+        except FileNotFoundError as e:
+            parser.error(f"Błąd: {e}")
+        if not inputs:
+            parser.error("Błąd: Nie znaleziono żadnych plików wejściowych w obsługiwanych formatach.")
+        return {
+            "batch": True,
+            "inputs": inputs,
+            "output_dir": os.path.abspath(args.output_dir),
+            "output_format": normalize_format(args.target_format),
+            "jobs": args.jobs,
+            "stream": args.stream,
+            "yaml_documents": args.yaml_documents,
+            "stats": stats,
+            "cache": cache,
+            "incremental": args.incremental
+        }
+
+    if args.incremental:
+        parser.error("Błąd: Tryb przyrostowy (--incremental) dotyczy konwersji wsadowej (--output-dir).")
+    if len(args.paths) != 2:
+        parser.error("Błąd: Podaj plik wejściowy i wyjściowy albo użyj --output-dir dla wielu plików.")
+
+    input_path, output_path = args.paths
 
     if not os.path.isabs(input_path):
         input_path = os.path.abspath(input_path)
@@ -45,47 +320,84 @@ def parse_arguments():
     _, input_ext = os.path.splitext(input_path)
     _, output_ext = os.path.splitext(output_path)
 
-    input_format = input_ext[1:].lower() if input_ext else None
-    output_format = output_ext[1:].lower() if output_ext else None
+    input_format = format_from_path(input_path)
+    output_format = format_from_path(output_path)
 
-    allowed_formats = ['xml', 'json', 'yml', 'yaml']
+    allowed_formats = format_extensions()
 
-    if input_format not in allowed_formats:
+    if input_format is None:
         parser.error(f"Błąd: Nieobsługiwane rozszerzenie pliku wejściowego: '{input_ext}'. Oczekiwano: {', '.join(allowed_formats)}")
-    if output_format not in allowed_formats:
+    if output_format is None:
         parser.error(f"Błąd: Nieobsługiwane rozszerzenie pliku wyjściowego: '{output_ext}'. Oczekiwano: {', '.join(allowed_formats)}")
 
-    if input_format == 'yml':
-        input_format = 'yaml'
-    if output_format == 'yml':
-        output_format = 'yaml'
-
     return {
+        "batch": False,
         "input_path": input_path,
         "input_format": input_format,
         "output_path": output_path,
-        "output_format": output_format
+        "output_format": output_format,
+        "stream": args.stream,
+        "yaml_documents": args.yaml_documents,
+        "parallel": args.parallel,
+        "shard_size": args.shard_size,
+        "jobs": args.jobs,
+        "stats": stats,
+        "profile": (args.profile_prefix or output_path + '.profile') if args.profile or args.profile_prefix else None,
+        "profile_top": args.profile_top,
+        "cache": cache
     }
 
+def expand_input_paths(patterns, skip_dir=None):
+    import glob
+    inputs = []
+    seen = set()
+    skip_dir = os.path.abspath(skip_dir) if skip_dir else None
+
+    def add(path, relative_path):
+        path = os.path.abspath(path)
+        if path not in seen and format_from_path(path):
+            seen.add(path)
+            inputs.append((path, relative_path))
+
+    def inside_skip_dir(path):
+        path = os.path.abspath(path)
+        return skip_dir is not None and (path == skip_dir or path.startswith(skip_dir + os.sep))
+
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            for dirpath, dirnames, filenames in os.walk(pattern):
+                dirnames[:] = sorted(name for name in dirnames
+                                     if os.path.abspath(os.path.join(dirpath, name)) != skip_dir)
+                for filename in sorted(filenames):
+                    path = os.path.join(dirpath, filename)
+                    add(path, os.path.relpath(path, pattern))
+        elif any(char in pattern for char in '*?['):
+            base = pattern
+            while any(char in base for char in '*?['):
+                base = os.path.dirname(base)
+            skip_outputs = not inside_skip_dir(base or os.curdir)
+            for path in sorted(glob.glob(pattern, recursive=True)):
+                if os.path.isfile(path) and not (skip_outputs and inside_skip_dir(path)):
+                    add(path, os.path.basename(path))
+        elif os.path.isfile(pattern):
+            if not format_from_path(pattern):
+                raise FileNotFoundError(f"Plik '{pattern}' ma nieobsługiwane rozszerzenie.")
+            add(pattern, os.path.basename(pattern))
+        else:
+            raise FileNotFoundError(f"Plik wejściowy '{pattern}' nie istnieje.")
+    return inputs
+
 
 def read_and_validate_data(file_path, file_format):
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            if file_format == 'json':
-                data = json.load(f)
-                print(f"  Pomyślnie wczytano i zweryfikowano JSON z '{file_path}'.")
-                return data
-            elif file_format == 'xml':
-                tree = ET.parse(f)
-                root = tree.getroot()
-                print(f"  Pomyślnie wczytano i zweryfikowano XML z '{file_path}'.")
-                return root
-            elif file_format == 'yaml':
-                data = yaml.safe_load(f)
-                print(f"  Pomyślnie wczytano i zweryfikowano YAML z '{file_path}'.")
-                return data
-            else:
-                raise ValueError(f"Wewnętrzny błąd: Nieobsługiwany format dla wczytywania: {file_format}")
+        spec = get_format(file_format)
+        loader = spec.backend('loader')
+        if loader is None:
+            raise ValueError(f"Wewnętrzny błąd: Nieobsługiwany format dla wczytywania: {file_format}")
+        with open(file_path, 'rb') as f:
+            data = loader(f)
+        print(f"  Pomyślnie wczytano i zweryfikowano {spec.label} z '{file_path}'{spec.engine_suffix()}.")
+        return data
     except FileNotFoundError:
         print(f"Błąd krytyczny: Plik '{file_path}' nie został znaleziony podczas próby odczytu.")
         return None
@@ -95,14 +407,14 @@ def read_and_validate_data(file_path, file_format):
     except ET.ParseError as e:
         print(f"Błąd składni XML w pliku '{file_path}': {e}")
         return None
-    except yaml.YAMLError as e:
-        print(f"Błąd składni YAML w pliku '{file_path}': {e}")
-        return None
     except UnicodeDecodeError as e:
         print(f"Błąd kodowania znaków w pliku '{file_path}': {e}. Upewnij się, że plik jest w UTF-8.")
         return None
     except Exception as e:
-        print(f"Wystąpił nieoczekiwany błąd podczas wczytywania '{file_path}': {e}")
+        if 'yaml' in sys.modules and isinstance(e, sys.modules['yaml'].YAMLError):
+            print(f"Błąd składni YAML w pliku '{file_path}': {e}")
+        else:
+            print(f"Wystąpił nieoczekiwany błąd podczas wczytywania '{file_path}': {e}")
         return None
 
 def write_data_to_json(data, output_path):
@@ -121,56 +433,332 @@ def write_data_to_json(data, output_path):
         print(f"Wystąpił nieoczekiwany błąd podczas zapisu do pliku JSON '{output_path}': {e}")
         return False
 
+def _write_stream_file(write_records, records, output_path, **options):
+    f = open(output_path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE)
+    try:
+        with f:
+            write_records(f, records, **options)
+    except Exception:
+        try:
+            os.remove(output_path)
+        except OSError:
+            pass
+        raise
+
+def _report_stream_error(format_name, output_path, e):
+    if isinstance(e, json.JSONDecodeError):
+        print(f"Błąd składni JSON w danych wejściowych: {e}")
+    elif isinstance(e, ET.ParseError):
+        print(f"Błąd składni XML w danych wejściowych: {e}")
+    elif 'yaml' in sys.modules and isinstance(e, sys.modules['yaml'].YAMLError):
+        print(f"Błąd składni YAML w danych wejściowych: {e}")
+    elif isinstance(e, UnicodeDecodeError):
+        print(f"Błąd kodowania znaków w danych wejściowych: {e}. Upewnij się, że plik jest w UTF-8.")
+    elif isinstance(e, _StreamUnsupported):
+        print(f"Tryb strumieniowy nie obsługuje danych wejściowych: {e}")
+    elif isinstance(e, TypeError):
+        print(f"Błąd zapisu do {format_name}: Dane nie mogą być serializowane: {e}")
+    elif isinstance(e, IOError):
+        print(f"Błąd zapisu do {format_name}: Problem z dostępem do pliku '{output_path}': {e}")
+    else:
+        print(f"Wystąpił nieoczekiwany błąd podczas strumieniowego zapisu do pliku {format_name} '{output_path}': {e}")
+
+EMPTY_OBJECT = object()
+
+class _StreamUnsupported(ValueError):
+    pass
+
+class RecordList:
+    def __init__(self, items):
+        self.items = items
+
+    def __iter__(self):
+        return iter(self.items)
+
+def _json_key(key):
+    if isinstance(key, str):
+        return key
+    if key is True:
+        return 'true'
+    if key is False:
+        return 'false'
+    if key is None:
+        return 'null'
+    if isinstance(key, int):
+        return int.__repr__(key)
+    if isinstance(key, float):
+        if key != key:
+            return 'NaN'
+        if key in (float('inf'), float('-inf')):
+            return 'Infinity' if key > 0 else '-Infinity'
+        return float.__repr__(key)
+    raise TypeError(f"keys must be str, int, float, bool or None, not {key.__class__.__name__}")
+
+def _write_json_records(f, records):
+    write = f.write
+    dumps = json.dumps
+    closing = None
+    empty = '[]'
+    for key, value in records:
+        if key is EMPTY_OBJECT:
+            empty = '{}'
+            continue
+        if closing is None:
+            closing = ']' if key is None else '}'
+            write('[\n    ' if key is None else '{\n    ')
+        else:
+            write(',\n    ')
+        if (key is None) != (closing == ']'):
+            raise ValueError("Strumień danych miesza elementy tablicy z polami obiektu.")
+        if key is not None:
+            write(dumps(_json_key(key), ensure_ascii=False))
+            write(': ')
+        if isinstance(value, RecordList):
+            separator = '[\n        '
+            for item in value:
+                write(separator)
+                write(dumps(item, indent=4, ensure_ascii=False).replace('\n', '\n        '))
+                separator = ',\n        '
+            write('\n    ]' if separator != '[\n        ' else '[]')
+            continue
+        write(dumps(value, indent=4, ensure_ascii=False).replace('\n', '\n    '))
+    write(empty if closing is None else '\n' + closing)
+
+def _json_run_frames(key):
+    opening = '[\n        ' if key is None else f"{json.dumps(_json_key(key), ensure_ascii=False)}: [\n        "
+    return opening, ',\n        ', '\n    ]'
+
+def write_json_stream(records, output_path):
+    try:
+        _write_stream_file(_write_json_records, records, output_path)
+        print(f"  Pomyślnie zapisano strumieniowo dane do pliku JSON: '{output_path}'.")
+        return True
+    except Exception as e:
+        _report_stream_error("JSON", output_path, e)
+        return False
+
+_xml_item_tags = {}
+
+def _xml_item_tag(tag):
+    item_tag = _xml_item_tags.get(tag)
+    if item_tag is None:
+        item_tag = tag[:-1] if tag.endswith('s') and len(tag) > 1 else "item"
+        if len(_xml_item_tags) > 10000:
+            _xml_item_tags.clear()
+        _xml_item_tags[tag] = item_tag
+    return item_tag
+
 def convert_dict_to_xml_element(tag, d):
-    elem = ET.Element(tag)
-    if isinstance(d, dict):
-        for key, val in d.items():
-            if isinstance(val, (dict, list)):
-                child_elem = convert_dict_to_xml_element(key, val)
-                elem.append(child_elem)
-            else:
+    root = ET.Element(tag)
+    stack = [(root, tag, d)]
+    while stack:
+        elem, tag, value = stack.pop()
+        if isinstance(value, dict):
+            for key, val in value.items():
                 child_elem = ET.SubElement(elem, key)
-                child_elem.text = str(val)
-    elif isinstance(d, list):
-        for item in d:
-            item_tag = tag[:-1] if tag.endswith('s') and len(tag) > 1 else "item"
-            if isinstance(item, dict):
-                child_elem = ET.SubElement(elem, item_tag)
-                for k, v in item.items():
-                    if isinstance(v, (dict, list)):
-                        sub_child = convert_dict_to_xml_element(k, v)
-                        child_elem.append(sub_child)
-                    else:
-                        sub_child = ET.SubElement(child_elem, k)
-                        sub_child.text = str(v)
-            else:
+                if isinstance(val, (dict, list)):
+                    stack.append((child_elem, key, val))
+                else:
+                    child_elem.text = str(val)
+        elif isinstance(value, list):
+            item_tag = _xml_item_tag(tag)
+            for item in value:
                 child_elem = ET.SubElement(elem, item_tag)
-                child_elem.text = str(item)
+                if isinstance(item, dict):
+                    stack.append((child_elem, item_tag, item))
+                else:
+                    child_elem.text = str(item)
+        else:
+            elem.text = str(value)
+    return root
+
+_XML_NAME_START = (
+    "A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF"
+    "\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF"
+    "\uFDF0-\uFFFD\U00010000-\U000EFFFF"
+)
+_XML_NAME_PATTERN = f"[{_XML_NAME_START}][{_XML_NAME_START}\\-.0-9\u00B7\u0300-\u036F\u203F-\u2040]*\\Z"
+_XML_INVALID_CHARS_RE = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\ud800-\udfff\ufffe\uffff]")
+_XML_SPECIAL_CHARS_RE = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\ud800-\udfff\ufffe\uffff&<>\"\r]")
+_xml_names = {}
+_xml_tag_parts = {}
+XML_CACHED_INDENT = 64
+
+class _XmlNamespaceTag(ValueError):
+    pass
+
+def _xml_name(tag):
+    name = _xml_names.get(tag) if isinstance(tag, str) else None
+    if name is not None:
+        return name
+    if not isinstance(tag, str):
+        raise TypeError(f"cannot serialize {tag!r} (type {type(tag).__name__})")
+    if tag.startswith('{'):
+        raise _XmlNamespaceTag(tag)
+    if not re.match(_XML_NAME_PATTERN, tag):
+        raise ValueError(f"Nieprawidłowa nazwa elementu XML: '{tag}'")
+    if len(_xml_names) > 10000:
+        _xml_names.clear()
+    _xml_names[tag] = tag
+    return tag
+
+def _xml_text(value):
+    value_class = value.__class__
+    if value_class is int or value_class is float or value_class is bool:
+        return str(value)
+    text = str(value)
+    if _XML_SPECIAL_CHARS_RE.search(text) is None:
+        return text
+    if _XML_INVALID_CHARS_RE.search(text):
+        raise ValueError(f"Niedozwolony znak w treści XML: {text!r}")
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    if '&' in text:
+        text = text.replace('&', '&amp;')
+    if '<' in text:
+        text = text.replace('<', '&lt;')
+    if '"' in text:
+        text = text.replace('"', '&quot;')
+    if '>' in text:
+        text = text.replace('>', '&gt;')
+    return text
+
+def _xml_tags_at(indent):
+    if len(indent) > XML_CACHED_INDENT:
+        return {}
+    tags = _xml_tag_parts.get(indent)
+    if tags is None or len(tags) > 10000:
+        tags = _xml_tag_parts[indent] = {}
+    return tags
+
+def _xml_parts(tags, tag, indent):
+    parts = tags.get(tag) if isinstance(tag, str) else None
+    if parts is None:
+        name = _xml_name(tag)
+        parts = (
+            f"{indent}<{name}>",
+            f"</{name}>\n",
+            f"{indent}<{name}/>\n",
+            f"{indent}<{name}>\n",
+            f"{indent}</{name}>\n"
+        )
+        tags[tag] = parts
+    return parts
+
+def _write_xml_value(write, tag, value, indent):
+    open_tag, close_tag, empty_tag, start_line, end_line = _xml_parts(_xml_tags_at(indent), tag, indent)
+    if not isinstance(value, (dict, list)):
+        text = _xml_text(value)
+        write(f"{open_tag}{text}{close_tag}" if text else empty_tag)
+        return
+    if not value:
+        write(empty_tag)
+        return
+    write(start_line)
+    child_indent = indent + "  "
+    if isinstance(value, dict):
+        stack = [(iter(value.items()), child_indent, _xml_tags_at(child_indent), end_line, None)]
     else:
-        elem.text = str(d)
-    return elem
+        stack = [(iter(value), child_indent, _xml_tags_at(child_indent), end_line, _xml_item_tag(tag))]
+    while stack:
+        entries, indent, tags, closing, item_tag = stack[-1]
+        for entry in entries:
+            if item_tag is None:
+                key, val = entry
+                nested = isinstance(val, (dict, list))
+            else:
+                key, val = item_tag, entry
+                nested = isinstance(val, dict)
+            parts = _xml_parts(tags, key, indent)
+            if not nested:
+                text = _xml_text(val)
+                write(f"{parts[0]}{text}{parts[1]}" if text else parts[2])
+                continue
+            if not val:
+                write(parts[2])
+                continue
+            write(parts[3])
+            child_indent = indent + "  "
+            if item_tag is None and isinstance(val, list):
+                stack.append((iter(val), child_indent, _xml_tags_at(child_indent), parts[4], _xml_item_tag(key)))
+            else:
+                stack.append((iter(val.items()), child_indent, _xml_tags_at(child_indent), parts[4], None))
+            break
+        else:
+            stack.pop()
+            write(closing)
+
+def _write_xml_records(f, records):
+    write = f.write
+    write('<?xml version="1.0" ?>\n')
+    opened = False
+    for key, value in records:
+        if key is EMPTY_OBJECT:
+            continue
+        if not opened:
+            write("<root>\n")
+            opened = True
+        if isinstance(value, RecordList):
+            _write_xml_list(write, "item" if key is None else key, value, "  ")
+        else:
+            _write_xml_value(write, "item" if key is None else key, value, "  ")
+    write("</root>\n" if opened else "<root/>\n")
+
+def _write_xml_list(write, tag, items, indent):
+    _, _, empty_tag, start_line, end_line = _xml_parts(_xml_tags_at(indent), tag, indent)
+    item_tag = _xml_item_tag(tag)
+    child_indent = indent + "  "
+    opened = False
+    for item in items:
+        if not opened:
+            write(start_line)
+            opened = True
+        _write_xml_value(write, item_tag, item, child_indent)
+    write(end_line if opened else empty_tag)
+
+def _xml_run_frames(key):
+    name = _xml_name("item" if key is None else key)
+    return f"  <{name}>\n", '', f"  </{name}>\n"
+
+def _iter_data_records(data):
+    if isinstance(data, dict):
+        return iter(data.items() if data else [(EMPTY_OBJECT, None)])
+    if isinstance(data, list):
+        return ((None, item) for item in data)
+    return iter([(None, data)])
+
+def _build_xml_root(data):
+    if isinstance(data, dict):
+        return convert_dict_to_xml_element("root", data)
+    root = ET.Element("root")
+    for item in data:
+        item_elem = convert_dict_to_xml_element("item", item)
+        root.append(item_elem)
+    return root
+
+def _xml_tree_pretty_string(root):
+    from xml.dom import minidom
+    rough_string = ET.tostring(root, 'utf-8')
+    reparsed = minidom.parseString(rough_string)
+    return reparsed.toprettyxml(indent="  ")
+
+def _write_xml_tree_pretty(root, output_path):
+    pretty_xml_as_string = _xml_tree_pretty_string(root)
+
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write(pretty_xml_as_string)
 
 def write_data_to_xml(data, output_path):
     try:
         if isinstance(data, ET.Element):
-            root = data
+            _write_xml_tree_pretty(data, output_path)
         elif isinstance(data, (dict, list)):
-            if isinstance(data, dict):
-                root = convert_dict_to_xml_element("root", data)
-            elif isinstance(data, list):
-                root = ET.Element("root")
-                for item in data:
-                    item_elem = convert_dict_to_xml_element("item", item)
-                    root.append(item_elem)
-            else:
-                raise TypeError(f"Błąd wewnętrzny: Nieobsługiwany typ danych do zapisu do XML: {type(data)}")
-
-        rough_string = ET.tostring(root, 'utf-8')
-        reparsed = minidom.parseString(rough_string)
-        pretty_xml_as_string = reparsed.toprettyxml(indent="  ")
-
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(pretty_xml_as_string)
+            try:
+                _write_stream_file(_write_xml_records, _iter_data_records(data), output_path)
+            except _XmlNamespaceTag:
+                _write_xml_tree_pretty(_build_xml_root(data), output_path)
+        else:
+            raise TypeError(f"Błąd wewnętrzny: Nieobsługiwany typ danych do zapisu do XML: {type(data)}")
         print(f"  Pomyślnie zapisano dane do pliku XML: '{output_path}'.")
         return True
     except TypeError as e:
@@ -186,36 +774,257 @@ def write_data_to_xml(data, output_path):
         print(f"Wystąpił nieoczekiwany błąd podczas zapisu do pliku XML '{output_path}': {e}")
         return False
 
-def convert_xml_to_dict(element):
-    result = {}
+def write_xml_stream(records, output_path):
+    try:
+        _write_stream_file(_write_xml_records, records, output_path)
+        print(f"  Pomyślnie zapisano strumieniowo dane do pliku XML: '{output_path}'.")
+        return True
+    except _XmlNamespaceTag as e:
+        print(f"Błąd zapisu do XML: Znaczniki z przestrzenią nazw ('{e}') nie są obsługiwane w trybie strumieniowym.")
+        return False
+    except Exception as e:
+        _report_stream_error("XML", output_path, e)
+        return False
 
-    if element.attrib:
-        result.update(element.attrib)
+def _xml_leaf_to_dict(element):
+    text = element.text
+    text = text.strip() if text else None
+    if not element.attrib:
+        return text if text else {}
+    result = dict(element.attrib)
+    if text:
+        result['#text'] = text
+    return result
 
-    for child in element:
-        child_data = convert_xml_to_dict(child)
-        if child.tag in result:
-            if not isinstance(result[child.tag], list):
-                result[child.tag] = [result[child.tag]]
-            result[child.tag].append(child_data)
+def convert_xml_to_dict(element):
+    if not len(element):
+        return _xml_leaf_to_dict(element)
+
+    root_result = dict(element.attrib)
+    stack = [(element, root_result)]
+    while stack:
+        parent, result = stack.pop()
+        for child in parent:
+            if len(child):
+                child_data = dict(child.attrib)
+                stack.append((child, child_data))
+            else:
+                child_data = _xml_leaf_to_dict(child)
+            tag = child.tag
+            if tag in result:
+                existing = result[tag]
+                if isinstance(existing, list):
+                    existing.append(child_data)
+                else:
+                    result[tag] = [existing, child_data]
+            else:
+                result[tag] = child_data
+        text = parent.text
+        if text:
+            text = text.strip()
+            if text:
+                result['#text'] = text
+
+    return root_result
+
+@contextlib.contextmanager
+def _open_source(source):
+    if hasattr(source, 'read'):
+        yield source
+    else:
+        with open(source, 'rb') as f:
+            yield f
+
+def iter_xml_records(source):
+    with _open_source(source) as f:
+        yield from _iter_xml_records(f)
+
+def _iter_xml_entries(f):
+    root = None
+    text = None
+    depth = 0
+    for event, elem in ET.iterparse(f, events=('start', 'end')):
+        if event == 'start':
+            if root is None:
+                root = elem
+                yield from elem.attrib.items()
+            depth += 1
+            continue
+        depth -= 1
+        if depth == 1:
+            if text is None:
+                text = root.text or ''
+            yield elem.tag, convert_xml_to_dict(elem)
+            root.clear()
+        elif depth == 0 and text is None:
+            text = root.text or ''
+            if text.strip() and not root.attrib:
+                raise _StreamUnsupported("Strumieniowy odczyt XML nie obsługuje elementu głównego zawierającego wyłącznie tekst.")
+    text = text.strip()
+    if text:
+        yield '#text', text
+
+def _iter_xml_records(f):
+    entries = _iter_xml_entries(f)
+    following = [next(entries, None)]
+    if following[0] is None:
+        yield EMPTY_OBJECT, None
+    seen = set()
+
+    def run(key, values):
+        yield from values
+        for entry in entries:
+            if entry[0] != key:
+                following[0] = entry
+                return
+            yield entry[1]
+
+    while following[0] is not None:
+        key, value = following[0]
+        if key in seen:
+            raise _StreamUnsupported(f"Strumieniowy odczyt XML wymaga, aby powtarzające się elementy '{key}' występowały "
+                             f"bezpośrednio po sobie; użyj trybu dokumentowego.")
+        seen.add(key)
+        entry = next(entries, None)
+        if entry is None or entry[0] != key:
+            following[0] = entry
+            yield key, value
+            continue
+        following[0] = None
+        items = run(key, (value, entry[1]))
+        yield key, RecordList(items)
+        for _ in items:
+            pass
+
+_JSON_WS_RE = re.compile(r'[ \t\n\r]*')
+_JSON_DELIMITERS = (',', ':', ']', '}')
+
+class _JsonStream:
+    def __init__(self, f):
+        self.f = f
+        self.decoder = codecs.getincrementaldecoder('utf-8')()
+        self.raw_decode = json.JSONDecoder().raw_decode
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+        self.offset = 0
+        self.line = 0
+        self.column = 0
+
+    def fill(self, size=READ_CHUNK_SIZE):
+        if self.pos:
+            dropped = self.buf[:self.pos]
+            newlines = dropped.count('\n')
+            if newlines:
+                self.line += newlines
+                self.column = len(dropped) - dropped.rindex('\n') - 1
+            else:
+                self.column += len(dropped)
+            self.offset += self.pos
+            self.buf = self.buf[self.pos:]
+            self.pos = 0
+        chunk = self.f.read(size)
+        if chunk:
+            self.buf += self.decoder.decode(chunk)
         else:
-            result[child.tag] = child_data
-
-    if element.text and element.text.strip():
-        text_content = element.text.strip()
-        if not result and not element.attrib:
-            return text_content
-        elif text_content:
-            result['#text'] = text_content
-
-    return result
+            self.buf += self.decoder.decode(b'', final=True)
+            self.eof = True
+
+    def peek(self):
+        while True:
+            self.pos = _JSON_WS_RE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if self.eof:
+                return ''
+            self.fill()
+
+    def value(self):
+        size = READ_CHUNK_SIZE
+        while True:
+            self.peek()
+            try:
+                value, end = self.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError as e:
+                if self.eof or (e.pos < len(self.buf) - 64 and not e.msg.startswith('Unterminated string')):
+                    raise self.error(e.msg, e.pos) from None
+                self.fill(size)
+                size = max(size, len(self.buf))
+                continue
+            after = _JSON_WS_RE.match(self.buf, end).end()
+            if self.eof or len(self.buf) - end > 64 or (after < len(self.buf) and self.buf[after] in _JSON_DELIMITERS):
+                self.pos = end
+                return value
+            self.fill(size)
+            size = max(size, len(self.buf))
+
+    def expect(self, char, message):
+        if self.peek() != char:
+            raise self.error(message, self.pos)
+        self.pos += 1
+
+    def error(self, message, pos):
+        newlines = self.buf.count('\n', 0, pos)
+        if newlines:
+            colno = pos - self.buf.rindex('\n', 0, pos)
+        else:
+            colno = self.column + pos + 1
+        lineno = self.line + newlines + 1
+        char = self.offset + pos
+        err = json.JSONDecodeError(message, self.buf, pos)
+        err.pos, err.lineno, err.colno = char, lineno, colno
+        err.args = (f"{message}: line {lineno} column {colno} (char {char})",)
+        return err
+
+def iter_json_records(source):
+    with _open_source(source) as f:
+        yield from _iter_json_records(f)
+
+def _iter_json_records(f):
+    stream = _JsonStream(f)
+    first = stream.peek()
+    if first == '\ufeff':
+        raise stream.error("Unexpected UTF-8 BOM (decode using utf-8-sig)", 0)
+    if first == '[':
+        stream.pos += 1
+        if stream.peek() == ']':
+            stream.pos += 1
+        else:
+            while True:
+                yield None, stream.value()
+                if stream.peek() == ']':
+                    stream.pos += 1
+                    break
+                stream.expect(',', "Expecting ',' delimiter")
+    elif first == '{':
+        stream.pos += 1
+        if stream.peek() == '}':
+            stream.pos += 1
+            yield EMPTY_OBJECT, None
+        else:
+            while True:
+                if stream.peek() != '"':
+                    raise stream.error("Expecting property name enclosed in double quotes", stream.pos)
+                key = stream.value()
+                stream.expect(':', "Expecting ':' delimiter")
+                yield key, stream.value()
+                if stream.peek() == '}':
+                    stream.pos += 1
+                    break
+                stream.expect(',', "Expecting ',' delimiter")
+    elif first == '':
+        raise stream.error("Expecting value", stream.pos)
+    else:
+        raise _StreamUnsupported("Strumieniowy odczyt JSON wymaga tablicy lub obiektu na najwyższym poziomie dokumentu.")
+    if stream.peek() != '':
+        raise stream.error("Extra data", stream.pos)
 
 def write_data_to_yaml(data, output_path):
-    
+    import yaml
     try:
         with open(output_path, 'w', encoding='utf-8') as f:
-            yaml.dump(data, f, allow_unicode=True, default_flow_style=False, sort_keys=False)
-        print(f"  Pomyślnie zapisano dane do pliku YAML: '{output_path}'.")
+            yaml.dump(data, f, Dumper=yaml_dumper_class(), allow_unicode=True, default_flow_style=False, sort_keys=False)
+        print(f"  Pomyślnie zapisano dane do pliku YAML: '{output_path}' (silnik: {yaml_backend_name()}).")
         return True
     except TypeError as e:
         print(f"Błąd zapisu do YAML: Dane nie mogą być serializowane. Upewnij się, że to słownik/lista: {e}")
@@ -227,270 +1036,2039 @@ def write_data_to_yaml(data, output_path):
         print(f"Wystąpił nieoczekiwany błąd podczas zapisu do pliku YAML '{output_path}': {e}")
         return False
 
-class ConverterWorker(QThread):
-    finished = pyqtSignal(bool, str) 
-    progress = pyqtSignal(str) 
+def iter_yaml_records(source):
+    with _open_source(source) as f:
+        yield from _iter_yaml_records(f)
+
+class _ReplayStream:
+    def __init__(self, head, f):
+        self.head = head
+        self.f = f
+
+    def read(self, size=-1):
+        if not self.head:
+            return self.f.read(size)
+        if size < 0:
+            data = self.head + self.f.read()
+            self.head = b''
+            return data
+        data = self.head[:size]
+        self.head = self.head[size:]
+        return data
+
+    def readline(self, size=-1):
+        if not self.head:
+            return self.f.readline(size)
+        newline = self.head.find(b'\n')
+        if newline < 0:
+            line = self.head + self.f.readline()
+            self.head = b''
+            return line
+        line = self.head[:newline + 1]
+        self.head = self.head[newline + 1:]
+        return line
+
+    def __iter__(self):
+        return iter(self.readline, b'')
+
+def _yaml_starts_with_sequence(head):
+    import yaml
+    newline = head.rfind(b'\n')
+    loader = yaml_loader_class()(head[:newline + 1] if newline >= 0 else head)
+    try:
+        try:
+            loader.get_event()
+            if not loader.check_event(yaml.DocumentStartEvent):
+                return False
+            loader.get_event()
+            if not loader.check_event(yaml.SequenceStartEvent):
+                return False
+        except yaml.YAMLError:
+            return False
+        try:
+            depth = 0
+            while True:
+                event = loader.get_event()
+                if isinstance(event, (yaml.SequenceStartEvent, yaml.MappingStartEvent)):
+                    depth += 1
+                elif isinstance(event, (yaml.SequenceEndEvent, yaml.MappingEndEvent)):
+                    depth -= 1
+                    if not depth:
+                        break
+            loader.get_event()
+            return loader.check_event(yaml.StreamEndEvent)
+        except yaml.YAMLError:
+            return True
+    finally:
+        loader.dispose()
+
+def _iter_yaml_records(f):
+    head = f.read(READ_CHUNK_SIZE)
+    stream = _ReplayStream(head, f)
+    if _yaml_starts_with_sequence(head):
+        yield from _iter_yaml_sequence_items(stream)
+    else:
+        yield from _iter_yaml_documents(yaml_loader_class()(stream))
+
+def _iter_yaml_documents(loader):
+    try:
+        if loader.check_data():
+            yield from _iter_yaml_following(loader, loader.get_data())
+    finally:
+        loader.dispose()
+
+def _iter_yaml_following(loader, first):
+    if not loader.check_data():
+        if isinstance(first, (dict, list)):
+            yield from _iter_data_records(first)
+        else:
+            yield None, first
+        return
+    yield None, first
+    while loader.check_data():
+        yield None, loader.get_data()
+
+def _iter_yaml_sequence_items(stream):
+    import yaml
+    loader = yaml_loader_class()(stream)
+    try:
+        loader.get_event()
+        loader.get_event()
+        if not loader.check_event(yaml.SequenceStartEvent):
+            document = loader.construct_document(_compose_yaml_node(loader, {}))
+            loader.get_event()
+            yield from _iter_yaml_following(loader, document)
+            return
+        anchors = {}
+        loader.get_event()
+        while not loader.check_event(yaml.SequenceEndEvent):
+            yield None, loader.construct_document(_compose_yaml_node(loader, anchors))
+        loader.get_event()
+        loader.get_event()
+        if not loader.check_event(yaml.StreamEndEvent):
+            raise ValueError(f"Strumieniowy odczyt YAML: po dokumencie będącym listą występuje kolejny dokument "
+                             f"(linia {loader.peek_event().start_mark.line + 1}), a elementy listy zostały już zapisane jako "
+                             f"osobne rekordy. Plik z wieloma dokumentami można czytać strumieniowo, gdy pierwszy "
+                             f"dokument nie jest listą albo mieści się w pierwszych {READ_CHUNK_SIZE // 1024} KB pliku.")
+    finally:
+        loader.dispose()
+
+def _compose_yaml_node(loader, anchors):
+    import yaml
+    event = loader.get_event()
+    anchor = event.anchor
+    if isinstance(event, yaml.AliasEvent):
+        if anchor not in anchors:
+            raise yaml.composer.ComposerError(None, None, f"found undefined alias {anchor!r}", event.start_mark)
+        return anchors[anchor]
+    if anchor is not None and anchor in anchors:
+        raise yaml.composer.ComposerError(f"found duplicate anchor {anchor!r}; first occurrence",
+                                          anchors[anchor].start_mark, "second occurrence", event.start_mark)
+    tag = event.tag
+    if isinstance(event, yaml.ScalarEvent):
+        if tag is None or tag == '!':
+            tag = loader.resolve(yaml.ScalarNode, event.value, event.implicit)
+        node = yaml.ScalarNode(tag, event.value, event.start_mark, event.end_mark, style=event.style)
+        if anchor is not None:
+            anchors[anchor] = node
+        return node
+    if isinstance(event, yaml.SequenceStartEvent):
+        if tag is None or tag == '!':
+            tag = loader.resolve(yaml.SequenceNode, None, event.implicit)
+        node = yaml.SequenceNode(tag, [], event.start_mark, None, flow_style=event.flow_style)
+        if anchor is not None:
+            anchors[anchor] = node
+        while not loader.check_event(yaml.SequenceEndEvent):
+            node.value.append(_compose_yaml_node(loader, anchors))
+    else:
+        if tag is None or tag == '!':
+            tag = loader.resolve(yaml.MappingNode, None, event.implicit)
+        node = yaml.MappingNode(tag, [], event.start_mark, None, flow_style=event.flow_style)
+        if anchor is not None:
+            anchors[anchor] = node
+        while not loader.check_event(yaml.MappingEndEvent):
+            key = _compose_yaml_node(loader, anchors)
+            node.value.append((key, _compose_yaml_node(loader, anchors)))
+    node.end_mark = loader.get_event().end_mark
+    return node
+
+def _emit_yaml_node(dumper, node):
+    import yaml
+    if isinstance(node, yaml.ScalarNode):
+        implicit = (
+            node.tag == dumper.resolve(yaml.ScalarNode, node.value, (True, False)),
+            node.tag == dumper.resolve(yaml.ScalarNode, node.value, (False, True)),
+        )
+        dumper.emit(yaml.ScalarEvent(None, node.tag, implicit, node.value, style=node.style))
+    elif isinstance(node, yaml.SequenceNode):
+        implicit = node.tag == dumper.resolve(yaml.SequenceNode, node.value, True)
+        dumper.emit(yaml.SequenceStartEvent(None, node.tag, implicit, flow_style=node.flow_style))
+        for item in node.value:
+            _emit_yaml_node(dumper, item)
+        dumper.emit(yaml.SequenceEndEvent())
+    else:
+        implicit = node.tag == dumper.resolve(yaml.MappingNode, node.value, True)
+        dumper.emit(yaml.MappingStartEvent(None, node.tag, implicit, flow_style=node.flow_style))
+        for key, value in node.value:
+            _emit_yaml_node(dumper, key)
+            _emit_yaml_node(dumper, value)
+        dumper.emit(yaml.MappingEndEvent())
+
+def _emit_yaml_data(dumper, data):
+    node = dumper.represent_data(data)
+    dumper.represented_objects = {}
+    dumper.object_keeper = []
+    dumper.alias_key = None
+    _emit_yaml_node(dumper, node)
+
+def _write_yaml_records(f, records, explicit_documents=False):
+    import yaml
+    dumper = yaml_dumper_class()(f, allow_unicode=True, default_flow_style=False, sort_keys=False)
+    try:
+        dumper.emit(yaml.StreamStartEvent())
+        mode = None
+        empty = 'sequence'
+        for key, value in records:
+            if key is EMPTY_OBJECT:
+                empty = 'mapping'
+                continue
+            if mode is None:
+                if key is None and explicit_documents:
+                    mode = 'documents'
+                elif key is None:
+                    mode = 'sequence'
+                    dumper.emit(yaml.DocumentStartEvent(explicit=False))
+                    dumper.emit(yaml.SequenceStartEvent(None, 'tag:yaml.org,2002:seq', True, flow_style=False))
+                else:
+                    mode = 'mapping'
+                    dumper.emit(yaml.DocumentStartEvent(explicit=False))
+                    dumper.emit(yaml.MappingStartEvent(None, 'tag:yaml.org,2002:map', True, flow_style=False))
+            if (key is None) == (mode == 'mapping'):
+                raise ValueError("Strumień danych miesza elementy listy z polami mapowania.")
+            if mode == 'documents':
+                dumper.emit(yaml.DocumentStartEvent(explicit=True))
+                _emit_yaml_data(dumper, value)
+                dumper.emit(yaml.DocumentEndEvent(explicit=False))
+                continue
+            if key is not None:
+                _emit_yaml_data(dumper, key)
+            if isinstance(value, RecordList):
+                dumper.emit(yaml.SequenceStartEvent(None, 'tag:yaml.org,2002:seq', True, flow_style=False))
+                for item in value:
+                    _emit_yaml_data(dumper, item)
+                dumper.emit(yaml.SequenceEndEvent())
+            else:
+                _emit_yaml_data(dumper, value)
+        if mode is None:
+            mode = empty
+            dumper.emit(yaml.DocumentStartEvent(explicit=False))
+            if mode == 'sequence':
+                dumper.emit(yaml.SequenceStartEvent(None, 'tag:yaml.org,2002:seq', True, flow_style=False))
+            else:
+                dumper.emit(yaml.MappingStartEvent(None, 'tag:yaml.org,2002:map', True, flow_style=False))
+        if mode != 'documents':
+            dumper.emit(yaml.SequenceEndEvent() if mode == 'sequence' else yaml.MappingEndEvent())
+            dumper.emit(yaml.DocumentEndEvent(explicit=False))
+        dumper.emit(yaml.StreamEndEvent())
+    finally:
+        dumper.dispose()
+
+def _yaml_run_frames(key):
+    buffer = io.StringIO()
+    _write_yaml_records(buffer, [(key, RecordList([None]))])
+    return buffer.getvalue()[:-len('- null\n')], '', ''
+
+def write_yaml_stream(records, output_path, explicit_documents=False):
+    try:
+        _write_stream_file(_write_yaml_records, records, output_path, explicit_documents=explicit_documents)
+        print(f"  Pomyślnie zapisano strumieniowo dane do pliku YAML: '{output_path}' (silnik: {yaml_backend_name()}).")
+        return True
+    except Exception as e:
+        _report_stream_error("YAML", output_path, e)
+        return False
 
-    def __init__(self, input_path, input_format, output_path, output_format):
-        super().__init__()
+def iter_jsonl_records(source):
+    with _open_source(source) as f:
+        for lineno, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                yield None, json.loads(line)
+            except json.JSONDecodeError as e:
+                raise json.JSONDecodeError(f"{e.msg} (linia {lineno})", e.doc, e.pos) from None
+
+def _write_jsonl_records(f, records):
+    write = f.write
+    dumps = json.dumps
+    for key, value in records:
+        if key is EMPTY_OBJECT:
+            continue
+        if isinstance(value, RecordList):
+            opening, separator, closing = _jsonl_run_frames(key)
+            write(opening)
+            for index, item in enumerate(value):
+                if index:
+                    write(separator)
+                write(dumps(item, ensure_ascii=False))
+            write(closing)
+            continue
+        if key is not None:
+            value = {key: value}
+        write(dumps(value, ensure_ascii=False))
+        write('\n')
+
+def _jsonl_run_frames(key):
+    if key is None:
+        return '[', ', ', ']\n'
+    return '{' + json.dumps(_json_key(key), ensure_ascii=False) + ': [', ', ', ']}\n'
+
+def write_jsonl_stream(records, output_path):
+    try:
+        _write_stream_file(_write_jsonl_records, records, output_path)
+        print(f"  Pomyślnie zapisano strumieniowo dane do pliku JSON Lines: '{output_path}'.")
+        return True
+    except Exception as e:
+        _report_stream_error("JSON Lines", output_path, e)
+        return False
+
+def write_data_to_jsonl(data, output_path):
+    try:
+        _write_stream_file(_write_jsonl_records, _iter_data_records(data), output_path)
+        print(f"  Pomyślnie zapisano dane do pliku JSON Lines: '{output_path}'.")
+        return True
+    except Exception as e:
+        _report_stream_error("JSON Lines", output_path, e)
+        return False
+
+def write_stream(records, output_path, output_format, **options):
+    spec = get_format(output_format)
+    try:
+        _write_stream_file(spec.backend('record_writer'), records, output_path, **options)
+        print(f"  Pomyślnie zapisano strumieniowo dane do pliku {spec.label}: '{output_path}'{spec.engine_suffix()}.")
+        return True
+    except Exception as e:
+        _report_stream_error(spec.label, output_path, e)
+        return False
+
+def write_data(data, output_path, output_format):
+    spec = get_format(output_format)
+    writer = spec.backend('writer')
+    if writer is not None:
+        return writer(data, output_path)
+    try:
+        _write_stream_file(lambda f, value: spec.backend('dumper')(value, f), data, output_path)
+        print(f"  Pomyślnie zapisano dane do pliku {spec.label}: '{output_path}'{spec.engine_suffix()}.")
+        return True
+    except Exception as e:
+        _report_stream_error(spec.label, output_path, e)
+        return False
+
+def _load_json(f):
+    return json.loads(f.read().decode('utf-8'))
+
+def _load_xml(f):
+    return ET.parse(f).getroot()
+
+def _load_yaml(f):
+    import yaml
+    return yaml.load(f, Loader=yaml_loader_class())
+
+def _load_jsonl(f):
+    return [value for _, value in iter_jsonl_records(f)]
+
+def _dump_json(data, f):
+    json.dump(data, f, indent=4, ensure_ascii=False)
+
+def _dump_yaml(data, f):
+    import yaml
+    yaml.dump(data, f, Dumper=yaml_dumper_class(), allow_unicode=True, default_flow_style=False, sort_keys=False)
+
+def _dump_jsonl(data, f):
+    _write_jsonl_records(f, _iter_data_records(data))
+
+def _dump_xml(data, f):
+    if not isinstance(data, (dict, list)):
+        raise TypeError(f"Nieobsługiwany typ danych do zapisu do XML: {type(data)}")
+    start = f.tell() if _seekable(f) else None
+    try:
+        _write_xml_records(f, _iter_data_records(data))
+    except _XmlNamespaceTag as e:
+        if start is None:
+            raise ValueError(f"Znaczniki z przestrzenią nazw ('{e}') wymagają wyjścia z możliwością przewijania.") from None
+        f.seek(start)
+        f.truncate()
+        f.write(_xml_tree_pretty_string(_build_xml_root(data)))
+
+def _sniff_xml(head):
+    return head.startswith(b'<')
+
+def _sniff_jsonl(head):
+    if not head.startswith(b'{'):
+        return False
+    first_line, newline, rest = head.partition(b'\n')
+    if not newline or not rest.strip():
+        return False
+    try:
+        json.loads(first_line)
+    except ValueError:
+        return False
+    return True
+
+def _sniff_json(head):
+    return head.startswith(b'[') or head.startswith(b'{') and not _sniff_jsonl(head)
+
+def _seekable(f):
+    return getattr(f, 'seekable', None) is not None and f.seekable()
+
+register_format(
+    'xml', extensions=('xml',), content_type='application/xml',
+    reader=iter_xml_records, record_writer=_write_xml_records, stream_writer=write_xml_stream,
+    loader=_load_xml, to_data=convert_xml_to_dict, dumper=_dump_xml, writer=write_data_to_xml,
+    sniffer=_sniff_xml, run_frames=_xml_run_frames,
+    shard_frames={
+        'array': ('<?xml version="1.0" ?>\n<root>\n', '', '</root>\n'),
+        'object': ('<?xml version="1.0" ?>\n<root>\n', '', '</root>\n'),
+    }
+)
+register_format(
+    'json', extensions=('json',), content_type='application/json',
+    reader=iter_json_records, record_writer=_write_json_records, stream_writer=write_json_stream,
+    loader=_load_json, dumper=_dump_json, writer=write_data_to_json,
+    sniffer=_sniff_json, run_frames=_json_run_frames,
+    shard_frames={'array': ('[\n    ', ',\n    ', '\n]'), 'object': ('{\n    ', ',\n    ', '\n}')}
+)
+register_format(
+    'jsonl', label="JSON Lines", extensions=('jsonl', 'ndjson'), stream=True, content_type='application/x-ndjson',
+    reader=iter_jsonl_records, record_writer=_write_jsonl_records, stream_writer=write_jsonl_stream,
+    loader=_load_jsonl, dumper=_dump_jsonl, writer=write_data_to_jsonl,
+    sniffer=_sniff_jsonl, run_frames=_jsonl_run_frames,
+    shard_frames={'array': ('', '', ''), 'object': ('', '', '')}
+)
+register_format(
+    'yaml', extensions=('yaml', 'yml'), writer_options=('explicit_documents',), content_type='application/yaml',
+    reader=iter_yaml_records, record_writer=_write_yaml_records, stream_writer=write_yaml_stream,
+    loader=_load_yaml, dumper=_dump_yaml, writer=write_data_to_yaml,
+    engine=yaml_backend_name, run_frames=_yaml_run_frames,
+    shard_frames={'array': ('', '', ''), 'object': ('', '', '')}
+)
+
+def _writer_options(spec, yaml_documents=False):
+    options = {'explicit_documents': yaml_documents}
+    return {name: value for name, value in options.items() if name in spec.writer_options}
+
+def _note_stream_unsupported(records, unsupported):
+    try:
+        yield from records
+    except _StreamUnsupported as e:
+        unsupported.append(e)
+        raise
+
+def convert_stream(input_path, input_format, output_path, output_format, yaml_documents=False, stats=None,
+                   unsupported=None):
+    input_spec = get_format(input_format)
+    output_spec = get_format(output_format)
+    reader = input_spec.backend('reader')
+    if reader is None or output_spec.record_writer is None and output_spec.stream_writer is None:
+        print(f"Błąd: Tryb strumieniowy nie obsługuje konwersji {input_spec.label} -> {output_spec.label}.")
+        return False
+    records = reader(input_path)
+    if unsupported is not None:
+        records = _note_stream_unsupported(records, unsupported)
+    if stats is not None:
+        records = stats.timed_records(records, 'read')
+    options = _writer_options(output_spec, yaml_documents)
+    start = time.perf_counter()
+    stream_writer = output_spec.backend('stream_writer')
+    if stream_writer is not None:
+        success = stream_writer(records, output_path, **options)
+    else:
+        success = write_stream(records, output_path, output_format, **options)
+    if stats is not None:
+        stats.add('write', time.perf_counter() - start - stats.stages.get('read', 0.0))
+    return success
+
+def _records_mode(records):
+    return 'array' if records[0][0] is None else 'object'
+
+def _serialize_shard(output_format, records, options):
+    spec = get_format(output_format)
+    buffer = io.StringIO()
+    spec.backend('record_writer')(buffer, records, **options)
+    prefix, _, suffix = spec.shard_frames[_records_mode(records)]
+    return _strip_frame(spec, buffer.getvalue(), prefix, suffix)
+
+def _serialize_run(output_format, key, items, options):
+    spec = get_format(output_format)
+    text = _serialize_shard(output_format, [(key, RecordList(items))], options)
+    opening, _, closing = spec.backend('run_frames')(key)
+    return _strip_frame(spec, text, opening, closing)
+
+def _strip_frame(spec, text, prefix, suffix):
+    if not text.startswith(prefix) or not text.endswith(suffix):
+        raise ValueError(f"Nieoczekiwana ramka fragmentu {spec.label}.")
+    return text[len(prefix):len(text) - len(suffix)]
+
+def _iter_shards(records, shard_size):
+    import itertools
+    records = iter(records)
+    while True:
+        shard = list(itertools.islice(records, shard_size))
+        if not shard:
+            return
+        yield shard
+
+def _iter_parallel_parts(records, output_format, mode, options, shard_size, submit):
+    spec = get_format(output_format)
+    separator = spec.shard_frames[mode][1]
+    written = False
+    shard = []
+    for record in records:
+        key, value = record
+        if (key is None) != (mode == 'array'):
+            raise ValueError("Strumień danych miesza elementy tablicy z polami obiektu.")
+        run = isinstance(value, RecordList)
+        if not run:
+            shard.append(record)
+            if len(shard) < shard_size:
+                continue
+        if shard:
+            if written:
+                yield separator
+            yield submit(_serialize_shard, output_format, shard, options)
+            written = True
+            shard = []
+        if not run:
+            continue
+        if written:
+            yield separator
+        written = True
+        run_frames = spec.backend('run_frames')
+        if run_frames is None:
+            yield _serialize_shard(output_format, [record], options)
+            continue
+        chunks = _iter_shards(value, shard_size)
+        chunk = next(chunks, None)
+        if chunk is None:
+            yield _serialize_shard(output_format, [(key, [])], options)
+            continue
+        opening, run_separator, closing = run_frames(key)
+        yield opening
+        while chunk is not None:
+            yield submit(_serialize_run, output_format, key, chunk, options)
+            chunk = next(chunks, None)
+            if chunk is not None:
+                yield run_separator
+        yield closing
+    if shard:
+        if written:
+            yield separator
+        yield submit(_serialize_shard, output_format, shard, options)
+
+def _write_records_parallel(f, records, output_format, options, shard_size, jobs):
+    import itertools
+    from collections import deque
+    from concurrent.futures import ProcessPoolExecutor
+    spec = get_format(output_format)
+    records = iter(records)
+    first = next(records, None)
+    if first is None or first[0] is EMPTY_OBJECT:
+        spec.backend('record_writer')(f, iter(() if first is None else [first]), **options)
+        return
+    mode = _records_mode([first])
+    prefix, _, suffix = spec.shard_frames[mode]
+    f.write(prefix)
+    pending = deque()
+    submitted = 0
+    executor = ProcessPoolExecutor(max_workers=jobs)
+
+    def submit(function, *args):
+        nonlocal submitted
+        submitted += 1
+        return executor.submit(function, *args)
+
+    def write_next():
+        nonlocal submitted
+        part = pending.popleft()
+        if not isinstance(part, str):
+            submitted -= 1
+            part = part.result()
+        f.write(part)
+
+    try:
+        records = itertools.chain([first], records)
+        for part in _iter_parallel_parts(records, output_format, mode, options, shard_size, submit):
+            pending.append(part)
+            while submitted >= jobs * 2:
+                write_next()
+        while pending:
+            write_next()
+    except BaseException:
+        executor.shutdown(wait=True, cancel_futures=True)
+        raise
+    executor.shutdown()
+    f.write(suffix)
+
+def convert_parallel(input_path, input_format, output_path, output_format, jobs=None, shard_size=PARALLEL_SHARD_SIZE,
+                     yaml_documents=False, stats=None):
+    input_spec = get_format(input_format)
+    output_spec = get_format(output_format)
+    reader = input_spec.backend('reader')
+    if reader is None or output_spec.record_writer is None or output_spec.shard_frames is None:
+        print(f"  Tryb równoległy nie obsługuje konwersji {input_spec.label} -> {output_spec.label}; "
+              f"konwersja strumieniowa w jednym procesie.")
+        return convert_stream(input_path, input_format, output_path, output_format, yaml_documents=yaml_documents, stats=stats)
+    jobs = jobs or os.cpu_count() or 1
+    records = reader(input_path)
+    if stats is not None:
+        records = stats.timed_records(records, 'read')
+    options = _writer_options(output_spec, yaml_documents)
+    start = time.perf_counter()
+    try:
+        _write_stream_file(_write_records_parallel, records, output_path, output_format=output_spec.name,
+                           options=options, shard_size=shard_size, jobs=jobs)
+        print(f"  Pomyślnie zapisano równolegle dane do pliku {output_spec.label}: '{output_path}' "
+              f"(procesy: {jobs}, rekordów we fragmencie: {shard_size}){output_spec.engine_suffix()}.")
+        success = True
+    except Exception as e:
+        _report_stream_error(output_spec.label, output_path, e)
+        success = False
+    if stats is not None:
+        stats.add('write', time.perf_counter() - start - stats.stages.get('read', 0.0))
+    return success
+
+def peak_rss_bytes():
+    try:
+        import resource
+    except ImportError:
+        return _peak_rss_bytes_windows()
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+def _peak_rss_bytes_windows():
+    try:
+        import ctypes
+        from ctypes import wintypes
+    except ImportError:
+        return None
+
+    class ProcessMemoryCounters(ctypes.Structure):
+        _fields_ = [
+            ("cb", wintypes.DWORD),
+            ("PageFaultCount", wintypes.DWORD),
+            ("PeakWorkingSetSize", ctypes.c_size_t),
+            ("WorkingSetSize", ctypes.c_size_t),
+            ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+            ("PagefileUsage", ctypes.c_size_t),
+            ("PeakPagefileUsage", ctypes.c_size_t),
+        ]
+
+    try:
+        counters = ProcessMemoryCounters()
+        counters.cb = ctypes.sizeof(counters)
+        process = ctypes.windll.kernel32.GetCurrentProcess()
+        if not ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb):
+            return None
+        return counters.PeakWorkingSetSize
+    except (AttributeError, OSError):
+        return None
+
+class ConversionStats:
+    def __init__(self, input_path=None, output_path=None, trace_memory=True):
         self.input_path = input_path
-        self.input_format = input_format
         self.output_path = output_path
+        self.trace_memory = trace_memory
+        self.stages = {}
+        self.success = None
+        self.total_seconds = None
+        self.bytes_in = None
+        self.bytes_out = None
+        self.peak_traced_bytes = None
+        self.peak_rss_bytes = None
+        self._started_tracing = False
+        self._start = None
+
+    def start(self):
+        if self.trace_memory:
+            import tracemalloc
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracing = True
+            tracemalloc.reset_peak()
+        self._start = time.perf_counter()
+
+    def add(self, name, seconds):
+        self.stages[name] = self.stages.get(name, 0.0) + seconds
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start)
+
+    def timed_records(self, records, name):
+        iterator = iter(records)
+        while True:
+            start = time.perf_counter()
+            try:
+                record = next(iterator)
+            except StopIteration:
+                self.add(name, time.perf_counter() - start)
+                return
+            self.add(name, time.perf_counter() - start)
+            yield record
+
+    def finish(self, success, bytes_in=None, bytes_out=None):
+        self.total_seconds = time.perf_counter() - self._start
+        self.success = success
+        if self.trace_memory:
+            import tracemalloc
+            if tracemalloc.is_tracing():
+                self.peak_traced_bytes = tracemalloc.get_traced_memory()[1]
+            if self._started_tracing:
+                tracemalloc.stop()
+                self._started_tracing = False
+        self.peak_rss_bytes = peak_rss_bytes()
+        self.bytes_in = bytes_in
+        self.bytes_out = bytes_out
+        if bytes_in is None and self.input_path and os.path.isfile(self.input_path):
+            self.bytes_in = os.path.getsize(self.input_path)
+        if bytes_out is None and success and self.output_path and os.path.isfile(self.output_path):
+            self.bytes_out = os.path.getsize(self.output_path)
+
+    def to_dict(self):
+        return {
+            "input_path": self.input_path,
+            "output_path": self.output_path,
+            "success": self.success,
+            "total_seconds": self.total_seconds,
+            "stages": dict(self.stages),
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "mb_per_s": self.bytes_in / self.total_seconds / (1024 * 1024) if self.bytes_in and self.total_seconds else None,
+            "peak_traced_bytes": self.peak_traced_bytes,
+            "peak_rss_bytes": self.peak_rss_bytes
+        }
+
+    def summary(self):
+        labels = {'read': "odczyt", 'xml_to_dict': "XML->dict", 'write': "zapis", 'cache_lookup': "pamięć podręczna"}
+        parts = [f"{labels.get(name, name)} {seconds:.3f} s" for name, seconds in self.stages.items()]
+        parts.append(f"razem {self.total_seconds:.3f} s")
+        if self.bytes_in is not None:
+            parts.append(f"wejście {_format_size(self.bytes_in)}")
+        if self.bytes_out is not None:
+            parts.append(f"wyjście {_format_size(self.bytes_out)}")
+        if self.peak_traced_bytes is not None:
+            parts.append(f"szczyt alokacji {_format_size(self.peak_traced_bytes)}")
+        if self.peak_rss_bytes is not None:
+            parts.append(f"szczyt RSS {_format_size(self.peak_rss_bytes)}")
+        return "Statystyki: " + ", ".join(parts)
+
+def _measure(stats, name):
+    return stats.stage(name) if stats is not None else contextlib.nullcontext()
+
+class ConversionResult(ConversionStats):
+    def __init__(self, input_format, output_format, input_path=None, output_path=None, trace_memory=False):
+        super().__init__(input_path, output_path, trace_memory=trace_memory)
+        self.input_format = input_format
         self.output_format = output_format
+        self.output = None
+
+    def to_dict(self):
+        result = super().to_dict()
+        result["input_format"] = self.input_format
+        result["output_format"] = self.output_format
+        return result
+
+class ConversionCancelled(Exception):
+    pass
+
+class ProgressMonitor:
+    def __init__(self, callback=None, cancelled=None, total=None, interval=0.1):
+        self.callback = callback
+        self.cancelled = cancelled
+        self.total = total
+        self.interval = interval
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self._next_report = 0.0
+
+    def check(self):
+        if self.cancelled is not None and self.cancelled():
+            raise ConversionCancelled("Konwersja została anulowana.")
+
+    def update(self, force=False):
+        if self.callback is None:
+            return
+        now = time.monotonic()
+        if force or now >= self._next_report:
+            self._next_report = now + self.interval
+            self.callback(self.bytes_read, self.total, self.bytes_written)
+
+class _ReadSource(io.RawIOBase):
+    def __init__(self, source, monitor=None):
+        self.source = source
+        self.monitor = monitor
+        self.read_bytes = 0
+
+    def readable(self):
+        return True
 
-    def run(self):
+    def readinto(self, buffer):
+        if self.monitor is not None:
+            self.monitor.check()
+        data = self.source.read(len(buffer))
+        size = len(data)
+        buffer[:size] = data
+        self.read_bytes += size
+        if self.monitor is not None:
+            self.monitor.bytes_read += size
+            self.monitor.update()
+        return size
+
+def _open_convert_source(source, monitor=None):
+    path, f, size = _open_plain_source(source)
+    if monitor is None:
+        return path, f, size, f
+    if monitor.total is None:
+        monitor.total = size
+    return path, io.BufferedReader(_ReadSource(f, monitor), READ_CHUNK_SIZE), size, f
+
+def _open_plain_source(source):
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return None, io.BytesIO(source), len(source)
+    if isinstance(source, (str, os.PathLike)):
+        path = os.fspath(source)
+        return path, open(path, 'rb'), os.path.getsize(path)
+    if isinstance(source, io.TextIOBase):
+        if hasattr(source, 'buffer'):
+            return None, source.buffer, None
+        data = source.read().encode('utf-8')
+        return None, io.BytesIO(data), len(data)
+    if isinstance(source, io.IOBase):
+        return None, source, None
+    if hasattr(source, 'read'):
+        return None, io.BufferedReader(_ReadSource(source), READ_CHUNK_SIZE), None
+    raise TypeError(f"Nieobsługiwany typ źródła danych: {type(source).__name__}")
+
+def convert(source, target=None, input_format=None, output_format=None, stream=False, yaml_documents=False,
+            trace_memory=False, progress=None, cancelled=None):
+    monitor = ProgressMonitor(progress, cancelled) if progress is not None or cancelled is not None else None
+    input_path, f, bytes_in, source_file = _open_convert_source(source, monitor)
+    owns_source = input_path is not None
+    try:
+        if input_format is None and input_path is not None:
+            input_format = format_from_path(input_path)
+        if input_format is None:
+            if _seekable(f):
+                position = f.tell()
+                head = f.read(SNIFF_SIZE)
+                f.seek(position)
+            elif hasattr(f, 'peek'):
+                head = f.peek(SNIFF_SIZE)[:SNIFF_SIZE]
+            else:
+                head = f.read(SNIFF_SIZE)
+                f = _ReplayStream(head, f)
+            input_format = sniff_format(head)
+        input_spec = get_format(input_format)
+
+        output_path = os.fspath(target) if isinstance(target, (str, os.PathLike)) else None
+        if output_format is None and output_path is not None:
+            output_format = format_from_path(output_path)
+        if output_format is None:
+            raise ValueError("Nie można ustalić formatu wyjściowego; podaj output_format.")
+        output_spec = get_format(output_format)
+
+        result = ConversionResult(input_spec.name, output_spec.name, input_path, output_path, trace_memory=trace_memory)
+        start_in = f.tell() if bytes_in is None and _seekable(f) else None
+        result.start()
+        streaming = stream or stream_required(input_spec.name, output_spec.name)
+        try:
+            written = _convert_into(f, target, output_path, monitor, input_spec, output_spec, result, streaming,
+                                    yaml_documents)
+        except _StreamUnsupported:
+            if stream or target is not None and output_path is None:
+                raise
+            if input_path is None and not isinstance(source, (bytes, bytearray, memoryview)):
+                raise
+            if owns_source:
+                source_file.close()
+            if monitor is not None:
+                monitor.bytes_read = monitor.bytes_written = 0
+            input_path, f, bytes_in, source_file = _open_convert_source(source, monitor)
+            written = _convert_into(f, target, output_path, monitor, input_spec, output_spec, result, False,
+                                    yaml_documents)
+        if start_in is not None:
+            bytes_in = f.tell() - start_in
+        elif isinstance(getattr(f, 'raw', None), _ReadSource):
+            bytes_in = f.raw.read_bytes
+        if monitor is not None:
+            monitor.update(force=True)
+        result.finish(True, bytes_in=bytes_in, bytes_out=written[0])
+        if target is None:
+            result.output = written[1]
+        return result
+    finally:
+        if owns_source:
+            source_file.close()
+
+def _convert_into(f, target, output_path, monitor, input_spec, output_spec, result, streaming, yaml_documents):
+    with _open_convert_target(target, output_path, monitor) as (out, written):
+        if streaming:
+            records = result.timed_records(input_spec.backend('reader')(f), 'read')
+            options = _writer_options(output_spec, yaml_documents)
+            start = time.perf_counter()
+            output_spec.backend('record_writer')(out, records, **options)
+            result.add('write', time.perf_counter() - start - result.stages.get('read', 0.0))
+        else:
+            with result.stage('read'):
+                data = input_spec.backend('loader')(f)
+            to_data = input_spec.backend('to_data')
+            if to_data is not None:
+                with result.stage(f"{input_spec.name}_to_dict"):
+                    data = to_data(data)
+            with result.stage('write'):
+                output_spec.backend('dumper')(data, out)
+    return written
+
+class _WriteTarget(io.RawIOBase):
+    def __init__(self, target, monitor=None):
+        self.target = target
+        self.monitor = monitor
+        self.written = 0
+        self.discard = False
+
+    def writable(self):
+        return True
+
+    def seekable(self):
+        return _seekable(self.target)
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        return self.target.seek(offset, whence)
+
+    def tell(self):
+        return self.target.tell()
+
+    def truncate(self, size=None):
+        return self.target.truncate(size)
+
+    def write(self, data):
+        if self.discard:
+            return len(data)
+        if self.monitor is not None:
+            self.monitor.check()
+        self.target.write(bytes(data))
+        self.written += len(data)
+        if self.monitor is not None:
+            self.monitor.bytes_written += len(data)
+            self.monitor.update()
+        return len(data)
+
+@contextlib.contextmanager
+def _open_convert_target(target, output_path, monitor=None):
+    written = [None, None]
+    if output_path is not None:
+        if monitor is None:
+            f = open(output_path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE)
+        else:
+            raw = open(output_path, 'wb', buffering=0)
+            f = io.TextIOWrapper(io.BufferedWriter(_WriteTarget(raw, monitor), WRITE_BUFFER_SIZE), encoding='utf-8')
+        try:
+            with f:
+                yield f, written
+        except BaseException:
+            if monitor is not None:
+                raw.close()
+            try:
+                os.remove(output_path)
+            except OSError:
+                pass
+            raise
+        finally:
+            if monitor is not None:
+                raw.close()
+        written[0] = os.path.getsize(output_path)
+    elif isinstance(target, io.TextIOBase):
+        yield target, written
+    elif target is None or hasattr(target, 'write'):
+        if target is None:
+            raw = io.BytesIO()
+        elif isinstance(target, io.IOBase):
+            raw = target
+        else:
+            raw = _WriteTarget(target)
+        start = raw.tell() if _seekable(raw) else None
+        output = _WriteTarget(raw, monitor)
+        f = io.TextIOWrapper(output, encoding='utf-8', newline='\n')
         try:
-            self.progress.emit("Rozpoczynanie konwersji w tle...")
+            yield f, written
+            f.flush()
+        except BaseException:
+            output.discard = True
+            raise
+        finally:
+            f.detach()
+        if target is None:
+            written[1] = raw.getvalue()
+            written[0] = len(written[1])
+        elif start is not None:
+            written[0] = raw.tell() - start
+        else:
+            written[0] = output.written
+    else:
+        raise TypeError(f"Nieobsługiwany typ celu zapisu: {type(target).__name__}")
+
+def conversion_options(input_format, output_format, stream=False, yaml_documents=False):
+    engines = []
+    for name in (input_format, output_format):
+        engine = get_format(name).backend('engine')
+        engines.append(engine() if engine is not None else None)
+    return {
+        "version": CONVERTER_VERSION,
+        "input_format": input_format,
+        "output_format": output_format,
+        "mode": 'stream' if stream or stream_required(input_format, output_format) else 'document',
+        "yaml_documents": yaml_documents,
+        "engines": engines
+    }
+
+def _hash_file(path, digest):
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CACHE_HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def default_cache_dir():
+    base = os.environ.get('XDG_CACHE_HOME') or os.environ.get('LOCALAPPDATA') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'data-converter')
+
+class ConversionCache:
+    def __init__(self, directory=None, max_size=CACHE_MAX_SIZE, link=False):
+        self.directory = os.path.abspath(directory or default_cache_dir())
+        self.objects_dir = os.path.join(self.directory, 'objects')
+        self.max_size = max_size
+        self.link = link
+
+    def key(self, input_path, input_format, output_format, stream=False, yaml_documents=False):
+        options = conversion_options(input_format, output_format, stream=stream, yaml_documents=yaml_documents)
+        return _hash_file(input_path, hashlib.sha256(json.dumps(options, sort_keys=True).encode('utf-8')))
+
+    def _entry_path(self, key):
+        return os.path.join(self.objects_dir, key[:2], key)
+
+    def _copy_into_place(self, source, destination, link):
+        directory = os.path.dirname(destination) or '.'
+        temp_path = os.path.join(directory, f".{os.path.basename(destination)}.{os.getpid()}.tmp")
+        try:
+            if link:
+                try:
+                    os.link(source, temp_path)
+                except OSError:
+                    shutil.copyfile(source, temp_path)
+            else:
+                shutil.copyfile(source, temp_path)
+            os.replace(temp_path, destination)
+        except BaseException:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            raise
+
+    def fetch(self, key, output_path):
+        entry_path = self._entry_path(key)
+        try:
+            os.utime(entry_path, None)
+        except OSError:
+            return False
+        self._copy_into_place(entry_path, output_path, self.link)
+        return True
+
+    def release(self, output_path):
+        try:
+            if os.stat(output_path).st_nlink > 1:
+                os.remove(output_path)
+        except OSError:
+            pass
+
+    def store(self, key, output_path, input_path, input_format, output_format):
+        size = os.path.getsize(output_path)
+        if size > self.max_size:
+            return False
+        entry_path = self._entry_path(key)
+        os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+        with open(entry_path + '.json', 'w', encoding='utf-8') as f:
+            json.dump({
+                "source": input_path,
+                "input_format": input_format,
+                "output_format": output_format,
+                "version": CONVERTER_VERSION,
+                "created": time.time()
+            }, f, ensure_ascii=False)
+        self._copy_into_place(output_path, entry_path, False)
+        return True
+
+    def entries(self):
+        result = []
+        if not os.path.isdir(self.objects_dir):
+            return result
+        for bucket in os.scandir(self.objects_dir):
+            if not bucket.is_dir():
+                continue
+            for entry in os.scandir(bucket.path):
+                if entry.name.endswith(('.json', '.tmp')) or not entry.is_file():
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                result.append({"key": entry.name, "path": entry.path, "size": stat.st_size, "last_used": stat.st_mtime})
+        result.sort(key=lambda item: item['last_used'])
+        return result
+
+    def metadata(self, entry):
+        try:
+            with open(entry['path'] + '.json', 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _remove(self, entry):
+        for path in (entry['path'], entry['path'] + '.json'):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def prune(self, max_size=None):
+        max_size = self.max_size if max_size is None else max_size
+        entries = self.entries()
+        total = sum(entry['size'] for entry in entries)
+        removed = freed = 0
+        for entry in entries:
+            if total <= max_size:
+                break
+            self._remove(entry)
+            total -= entry['size']
+            removed += 1
+            freed += entry['size']
+        return removed, freed
+
+    def clear(self):
+        entries = self.entries()
+        for entry in entries:
+            self._remove(entry)
+        return len(entries), sum(entry['size'] for entry in entries)
+
+def run_conversion(input_path, input_format, output_path, output_format, stream=False, yaml_documents=False, stats=None,
+                   parallel=False, jobs=None, shard_size=PARALLEL_SHARD_SIZE, cache=None):
+    if cache is not None:
+        with _measure(stats, 'cache_lookup'):
+            key = cache.key(input_path, input_format, output_format, stream=stream or parallel, yaml_documents=yaml_documents)
+            hit = cache.fetch(key, output_path)
+        if hit:
+            print(f"\nWynik znaleziony w pamięci podręcznej (klucz {key[:12]}), "
+                  f"{'dowiązano' if cache.link else 'skopiowano'} do pliku: '{output_path}'.")
+            return True
+        cache.release(output_path)
+        success = run_conversion(input_path, input_format, output_path, output_format, stream=stream,
+                                 yaml_documents=yaml_documents, stats=stats, parallel=parallel, jobs=jobs,
+                                 shard_size=shard_size)
+        if success:
+            try:
+                cache.store(key, output_path, input_path, input_format, output_format)
+            except OSError as e:
+                print(f"Ostrzeżenie: Nie udało się zapisać wyniku w pamięci podręcznej: {e}")
+        return success
+
+    if parallel:
+        print("\nRozpoczynanie równoległej konwersji danych...")
+        return convert_parallel(input_path, input_format, output_path, output_format, jobs=jobs, shard_size=shard_size,
+                                yaml_documents=yaml_documents, stats=stats)
+
+    if stream or stream_required(input_format, output_format):
+        print("\nRozpoczynanie strumieniowej konwersji danych...")
+        unsupported = []
+        success = convert_stream(input_path, input_format, output_path, output_format, yaml_documents=yaml_documents,
+                                 stats=stats, unsupported=None if stream else unsupported)
+        if success or not unsupported:
+            return success
+        print("  Ponawianie konwersji w trybie dokumentowym...")
+
+    print("\nRozpoczynanie wczytywania i walidacji pliku wejściowego...")
+    with _measure(stats, 'read'):
+        input_data = read_and_validate_data(input_path, input_format)
+
+    if input_data is None:
+        print("Błąd: Nie udało się wczytać lub zweryfikować pliku wejściowego.")
+        return False
 
-            input_data = read_and_validate_data(
-                self.input_path,
-                self.input_format
+    input_spec = get_format(input_format)
+    to_data = input_spec.backend('to_data')
+    if to_data is not None:
+        print(f"  Konwersja {input_spec.label} na słownik/listę Pythona...")
+        with _measure(stats, f"{input_spec.name}_to_dict"):
+            data_for_conversion = to_data(input_data)
+        if data_for_conversion is None:
+            print(f"Błąd: Konwersja {input_spec.label} na słownik Pythona nie powiodła się.")
+            return False
+    else:
+        data_for_conversion = input_data
+        print(f"  Dane wejściowe są już w formie słownika/listy Pythona (z {input_spec.label}).")
+
+    output_spec = get_format(output_format)
+    print(f"\nRozpoczynanie zapisu danych do pliku {output_spec.label}...")
+    with _measure(stats, 'write'):
+        return write_data(data_for_conversion, output_path, output_format)
+
+def convert_file_job(job):
+    log = io.StringIO()
+    stats = ConversionStats(job['input_path'], job['output_path']) if job.get('stats') else None
+    cache = ConversionCache(**job['cache']) if job.get('cache') else None
+    start = time.perf_counter()
+    signature = None
+    if job.get('incremental'):
+        signature = input_signature(job['input_path'])
+        if signature['sha256'] == job.get('expected_sha256'):
+            return {
+                "stats": None,
+                "input_path": job['input_path'],
+                "output_path": job['output_path'],
+                "success": True,
+                "skipped": True,
+                "seconds": time.perf_counter() - start,
+                "bytes_in": signature['size'],
+                "bytes_out": os.path.getsize(job['output_path']),
+                "log": "",
+                "input_signature": signature
+            }
+    if stats is not None:
+        stats.start()
+    try:
+        with contextlib.redirect_stdout(log):
+            os.makedirs(os.path.dirname(job['output_path']), exist_ok=True)
+            success = run_conversion(
+                job['input_path'],
+                job['input_format'],
+                job['output_path'],
+                job['output_format'],
+                stream=job['stream'],
+                yaml_documents=job['yaml_documents'],
+                stats=stats,
+                cache=cache
             )
+    except Exception as e:
+        log.write(f"Wystąpił nieoczekiwany błąd: {e}\n")
+        success = False
+    seconds = time.perf_counter() - start
+    if stats is not None:
+        stats.finish(success)
+    return {
+        "stats": stats.to_dict() if stats is not None else None,
+        "input_path": job['input_path'],
+        "output_path": job['output_path'],
+        "success": success,
+        "skipped": False,
+        "seconds": seconds,
+        "bytes_in": os.path.getsize(job['input_path']),
+        "bytes_out": os.path.getsize(job['output_path']) if success else 0,
+        "log": log.getvalue(),
+        "input_signature": signature
+    }
 
-            if input_data is None:
-                self.finished.emit(False, "Nie udało się wczytać lub zweryfikować pliku wejściowego. Sprawdź logi.")
-                return
+def convert_job(job):
+    start = time.perf_counter()
+    try:
+        os.makedirs(os.path.dirname(job['output_path']) or '.', exist_ok=True)
+        result = convert(
+            job['input_path'],
+            job['output_path'],
+            input_format=job['input_format'],
+            output_format=job['output_format'],
+            stream=job['stream'],
+            yaml_documents=job['yaml_documents']
+        )
+    except Exception as e:
+        return {
+            "input_path": job['input_path'],
+            "output_path": job['output_path'],
+            "success": False,
+            "seconds": time.perf_counter() - start,
+            "bytes_in": os.path.getsize(job['input_path']) if os.path.isfile(job['input_path']) else 0,
+            "bytes_out": 0,
+            "error": str(e)
+        }
+    return {
+        "input_path": job['input_path'],
+        "output_path": job['output_path'],
+        "success": True,
+        "seconds": time.perf_counter() - start,
+        "bytes_in": result.bytes_in,
+        "bytes_out": result.bytes_out,
+        "error": None
+    }
 
-            self.progress.emit("Walidacja pliku wejściowego zakończona sukcesem.")
+def build_batch_jobs(parsed_args):
+    jobs = []
+    for input_path, relative_path in parsed_args['inputs']:
+        input_format = format_from_path(input_path)
+        output_format = parsed_args['output_format']
+        output_path = os.path.join(
+            parsed_args['output_dir'],
+            os.path.splitext(relative_path)[0] + '.' + output_format
+        )
+        jobs.append({
+            "input_path": input_path,
+            "input_format": input_format,
+            "output_path": output_path,
+            "output_format": output_format,
+            "stream": parsed_args['stream'],
+            "yaml_documents": parsed_args['yaml_documents'],
+            "stats": parsed_args['stats'] is not None,
+            "cache": parsed_args.get('cache')
+        })
+    return jobs
+
+def input_signature(path):
+    stat = os.stat(path)
+    return {
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sha256": _hash_file(path, hashlib.sha256())
+    }
 
-            data_for_conversion = None
-            if self.input_format == 'xml':
-                if isinstance(input_data, ET.Element):
-                    self.progress.emit("  Konwersja XML (ElementTree) na słownik/listę Pythona...")
-                    data_for_conversion = convert_xml_to_dict(input_data)
-                    if data_for_conversion is None:
-                        self.finished.emit(False, "Konwersja XML na wewnętrzny format nie powiodła się.")
-                        return
-                else:
-                    self.finished.emit(False, f"Błąd wewnętrzny: Oczekiwano obiektu ElementTree dla formatu XML, otrzymano {type(input_data)}.")
-                    return
-            elif self.input_format in ['json', 'yaml']:
-                data_for_conversion = input_data
-                self.progress.emit(f"  Dane wejściowe są już w formie słownika/listy Pythona (z {self.input_format.upper()}).")
-            else:
-                self.finished.emit(False, f"Błąd wewnętrzny: Nieznany format wejściowy do konwersji: {self.input_format}.")
-                return
+def manifest_key(output_dir, output_path):
+    return os.path.relpath(output_path, output_dir).replace(os.sep, '/')
 
-            write_success = False
-            if self.output_format == 'json':
-                self.progress.emit("\nRozpoczynanie zapisu danych do pliku JSON...")
-                write_success = write_data_to_json(data_for_conversion, self.output_path)
-            elif self.output_format == 'xml':
-                self.progress.emit("\nRozpoczynanie zapisu danych do pliku XML...")
-                write_success = write_data_to_xml(data_for_conversion, self.output_path)
-            elif self.output_format == 'yaml':
-                self.progress.emit("\nRozpoczynanie zapisu danych do pliku YAML...")
-                write_success = write_data_to_yaml(data_for_conversion, self.output_path)
-            else:
-                self.finished.emit(False, f"Błąd wewnętrzny: Nieznany format wyjściowy do zapisu: {self.output_format}.")
-                return
+def load_manifest(output_dir):
+    try:
+        with open(os.path.join(output_dir, MANIFEST_NAME), 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(manifest, dict) or not isinstance(manifest.get('outputs'), dict):
+        return {}
+    return manifest['outputs']
+
+def save_manifest(output_dir, outputs):
+    manifest_path = os.path.join(output_dir, MANIFEST_NAME)
+    temp_path = f"{manifest_path}.{os.getpid()}.tmp"
+    os.makedirs(output_dir, exist_ok=True)
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump({"version": CONVERTER_VERSION, "outputs": outputs}, f, ensure_ascii=False)
+    os.replace(temp_path, manifest_path)
+
+def job_freshness(job, entry):
+    if entry is None or entry.get('options') != job['options']:
+        return 'stale'
+    try:
+        output_stat = os.stat(job['output_path'])
+        input_stat = os.stat(job['input_path'])
+    except OSError:
+        return 'stale'
+    if output_stat.st_size != entry['output_size'] or output_stat.st_mtime_ns != entry['output_mtime_ns']:
+        return 'stale'
+    if input_stat.st_size != entry['input_size']:
+        return 'stale'
+    if input_stat.st_mtime_ns != entry['input_mtime_ns']:
+        return 'verify'
+    return 'fresh'
+
+def manifest_entry(job, signature):
+    output_stat = os.stat(job['output_path'])
+    return {
+        "input_path": job['input_path'],
+        "input_size": signature['size'],
+        "input_mtime_ns": signature['mtime_ns'],
+        "input_sha256": signature['sha256'],
+        "options": job['options'],
+        "output_size": output_stat.st_size,
+        "output_mtime_ns": output_stat.st_mtime_ns
+    }
 
-            if write_success:
-                self.finished.emit(True, "Konwersja zakończona pomyślnie!")
+def _format_size(num_bytes):
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if num_bytes < 1024 or unit == 'GB':
+            return f"{num_bytes:.0f} {unit}" if unit == 'B' else f"{num_bytes:.1f} {unit}"
+        num_bytes /= 1024
+
+def run_batch(parsed_args):
+    jobs = []
+    duplicates = []
+    output_paths = set()
+    for job in build_batch_jobs(parsed_args):
+        output_key = os.path.normcase(job['output_path'])
+        (duplicates if output_key in output_paths else jobs).append(job)
+        output_paths.add(output_key)
+
+    manifest = None
+    up_to_date = 0
+    if parsed_args.get('incremental'):
+        manifest = load_manifest(parsed_args['output_dir'])
+        pending = []
+        for job in jobs:
+            job['options'] = conversion_options(job['input_format'], job['output_format'],
+                                                stream=job['stream'], yaml_documents=job['yaml_documents'])
+            entry = manifest.get(manifest_key(parsed_args['output_dir'], job['output_path']))
+            state = job_freshness(job, entry)
+            if state == 'fresh':
+                up_to_date += 1
+                continue
+            job['incremental'] = True
+            if state == 'verify':
+                job['expected_sha256'] = entry['input_sha256']
+            pending.append(job)
+        jobs = pending
+
+    workers = min(parsed_args['jobs'], len(jobs)) or 1
+    print(f"Konwersja wsadowa: liczba plików {len(jobs)} -> {parsed_args['output_dir']} "
+          f"(format: {parsed_args['output_format']}, procesy: {workers})")
+    if manifest is not None:
+        print(f"Tryb przyrostowy: {up_to_date} plików aktualnych według manifestu, do sprawdzenia/konwersji: {len(jobs)}")
+
+    start = time.perf_counter()
+    if workers == 1:
+        results = [convert_file_job(job) for job in jobs]
+    else:
+        import concurrent.futures
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(convert_file_job, jobs, chunksize=max(1, len(jobs) // (workers * 8))))
+    elapsed = time.perf_counter() - start
+    if parsed_args.get('cache'):
+        prune_cache(ConversionCache(**parsed_args['cache']))
+    if manifest is not None:
+        for job, result in zip(jobs, results):
+            key = manifest_key(parsed_args['output_dir'], job['output_path'])
+            if result['success']:
+                manifest[key] = manifest_entry(job, result['input_signature'])
             else:
-                self.finished.emit(False, "Wystąpił błąd podczas konwersji. Sprawdź logi.")
-
+                manifest.pop(key, None)
+        save_manifest(parsed_args['output_dir'], manifest)
+
+    print("\nPodsumowanie konwersji:")
+    for result in results:
+        if result['skipped']:
+            up_to_date += 1
+            continue
+        status = "OK " if result['success'] else "BŁĄD"
+        rate = result['bytes_in'] / result['seconds'] / (1024 * 1024) if result['seconds'] else 0.0
+        print(f"  [{status}] {result['input_path']} -> {result['output_path']} "
+              f"({result['seconds']:.3f} s, {_format_size(result['bytes_in'])}, {rate:.2f} MB/s)")
+        if not result['success']:
+            for line in result['log'].strip().splitlines():
+                print(f"        {line}")
+    for job in duplicates:
+        print(f"  [BŁĄD] {job['input_path']} -> {job['output_path']} (pominięto: plik wyjściowy powtarza się w partii)")
+
+    succeeded = sum(1 for result in results if result['success'] and not result['skipped'])
+    failed = sum(1 for result in results if not result['success']) + len(duplicates)
+    total_in = sum(result['bytes_in'] for result in results if not result['skipped'])
+    total_out = sum(result['bytes_out'] for result in results if not result['skipped'])
+    if manifest is not None:
+        print(f"\nPliki: {succeeded} udanych, {failed} nieudanych, {up_to_date} aktualnych (pominięto), "
+              f"czas: {elapsed:.2f} s")
+    else:
+        print(f"\nPliki: {succeeded} udanych, {failed} nieudanych, czas: {elapsed:.2f} s")
+    if elapsed:
+        print(f"Przepustowość: {total_in / elapsed / (1024 * 1024):.2f} MB/s, {len(results) / elapsed:.1f} plików/s "
+              f"(wejście {_format_size(total_in)}, wyjście {_format_size(total_out)})")
+    if parsed_args['stats'] is not None:
+        write_stats_report({
+            "total_seconds": elapsed,
+            "files": [result['stats'] for result in results]
+        }, parsed_args['stats'])
+    return failed == 0
+
+def preload_engines():
+    for spec in FORMATS.values():
+        engine = spec.backend('engine')
+        if engine is not None:
+            engine()
+
+def _warm_worker():
+    import signal
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    preload_engines()
+
+def scan_tree(root, skip_dir=None):
+    snapshot = {}
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.name.startswith('.'):
+                    continue
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.path != skip_dir:
+                            stack.append(entry.path)
+                    elif format_from_path(entry.name) and entry.is_file():
+                        stat = entry.stat()
+                        snapshot[entry.path] = (stat.st_size, stat.st_mtime_ns)
+                except OSError:
+                    continue
+    return snapshot
+
+class FolderWatcher:
+    def __init__(self, roots, output_dir, output_format, jobs=1, interval=WATCH_INTERVAL, debounce=WATCH_DEBOUNCE,
+                 stream=False, yaml_documents=False, cache=None):
+        self.roots = [os.path.abspath(root) for root in roots]
+        self.output_dir = os.path.abspath(output_dir)
+        self.output_format = output_format
+        self.jobs = jobs
+        self.interval = interval
+        self.debounce = debounce
+        self.stream = stream
+        self.yaml_documents = yaml_documents
+        self.cache = cache
+        self.manifest = load_manifest(self.output_dir)
+        self.known = {}
+        self.pending = {}
+        self.in_flight = {}
+        self.busy = set()
+        self.converted = 0
+        self.failed = 0
+
+    def make_job(self, root, path):
+        job = build_batch_jobs({
+            "inputs": [(path, os.path.relpath(path, root))],
+            "output_format": self.output_format,
+            "output_dir": self.output_dir,
+            "stream": self.stream,
+            "yaml_documents": self.yaml_documents,
+            "stats": None,
+            "cache": self.cache
+        })[0]
+        job['options'] = conversion_options(job['input_format'], job['output_format'],
+                                            stream=job['stream'], yaml_documents=job['yaml_documents'])
+        job['incremental'] = True
+        return job
+
+    def scan(self, initial=False):
+        now = time.monotonic()
+        wall_now = time.time()
+        seen = set()
+        for root in self.roots:
+            for path, signature in scan_tree(root, skip_dir=self.output_dir).items():
+                seen.add(path)
+                if self.known.get(path) == signature:
+                    continue
+                state = self.pending.get(path)
+                if state is None or state['signature'] != signature:
+                    state = {
+                        "root": root,
+                        "signature": signature,
+                        "first_seen": state['first_seen'] if state else now,
+                        "changed_at": now,
+                        "settled": initial and wall_now - signature[1] / 1e9 >= self.debounce
+                    }
+                    self.pending[path] = state
+        for path in [path for path in self.known if path not in seen]:
+            del self.known[path]
+            self.log(f"[USUNIĘTO] {path} (plik wyjściowy pozostaje bez zmian)")
+        for path in [path for path in self.pending if path not in seen]:
+            del self.pending[path]
+        return now
+
+    def submit_ready(self, executor, now):
+        for path, state in list(self.pending.items()):
+            if path in self.busy:
+                continue
+            if not state['settled'] and now - state['changed_at'] < self.debounce:
+                continue
+            del self.pending[path]
+            job = self.make_job(state['root'], path)
+            entry = self.manifest.get(manifest_key(self.output_dir, job['output_path']))
+            freshness = job_freshness(job, entry)
+            if freshness == 'fresh':
+                self.known[path] = state['signature']
+                continue
+            if freshness == 'verify':
+                job['expected_sha256'] = entry['input_sha256']
+            self.busy.add(path)
+            future = executor.submit(convert_file_job, job)
+            self.in_flight[future] = (path, job, state)
+
+    def finish(self, future):
+        path, job, state = self.in_flight.pop(future)
+        self.busy.discard(path)
+        self.known[path] = state['signature']
+        latency = time.monotonic() - state['first_seen']
+        try:
+            result = future.result()
         except Exception as e:
-            import traceback
-            error_details = traceback.format_exc()
-            self.progress.emit(f"FATALNY BŁĄD WĄTKU KONWERSJI: {e}\n{error_details}")
-            self.finished.emit(False, f"Wystąpił nieoczekiwany błąd globalny: {e}")
-
-class DataConverterApp(QWidget):
-    def __init__(self):
-        super().__init__()
-        self.init_ui()
-
-    def init_ui(self):
-        self.setWindowTitle('Konwerter Danych (XML, JSON, YAML)')
-        self.setGeometry(100, 100, 700, 450)
-
-        main_layout = QVBoxLayout()
-
-        input_layout = QHBoxLayout()
-        self.input_label = QLabel('Plik wejściowy:')
-        self.input_path_edit = QLineEdit()
-        self.input_path_edit.setPlaceholderText("Wybierz plik wejściowy...")
-        self.input_browse_btn = QPushButton('Przeglądaj...')
-        self.input_browse_btn.clicked.connect(self.browse_input_file)
-        self.input_format_label = QLabel('Format wejściowy:')
-        self.input_format_combo = QComboBox()
-        self.input_format_combo.addItems(['json', 'xml', 'yaml'])
-
-        input_layout.addWidget(self.input_label)
-        input_layout.addWidget(self.input_path_edit)
-        input_layout.addWidget(self.input_browse_btn)
-        input_layout.addWidget(self.input_format_label)
-        input_layout.addWidget(self.input_format_combo)
-        main_layout.addLayout(input_layout)
-
-        output_layout = QHBoxLayout()
-        self.output_label = QLabel('Plik wyjściowy:')
-        self.output_path_edit = QLineEdit()
-        self.output_path_edit.setPlaceholderText("Wybierz lub wprowadź nazwę pliku wyjściowego...")
-        self.output_browse_btn = QPushButton('Przeglądaj...')
-        self.output_browse_btn.clicked.connect(self.browse_output_file)
-        self.output_format_label = QLabel('Format wyjściowy:')
-        self.output_format_combo = QComboBox()
-        self.output_format_combo.addItems(['json', 'xml', 'yaml'])
-
-        output_layout.addWidget(self.output_label)
-        output_layout.addWidget(self.output_path_edit)
-        output_layout.addWidget(self.output_browse_btn)
-        output_layout.addWidget(self.output_format_label)
-        output_layout.addWidget(self.output_format_combo)
-        main_layout.addLayout(output_layout)
-
-        self.convert_btn = QPushButton('Konwertuj')
-        self.convert_btn.setFixedHeight(40)
-        self.convert_btn.setStyleSheet("background-color: #4CAF50; color: white; font-weight: bold;")
-        self.convert_btn.clicked.connect(self.perform_conversion)
-        main_layout.addWidget(self.convert_btn)
-
-        self.log_output = QTextEdit()
-        self.log_output.setReadOnly(True)
-        self.log_output.setStyleSheet("background-color: #f0f0f0; border: 1px solid #ccc;")
-        main_layout.addWidget(QLabel("Logi operacji:"))
-        main_layout.addWidget(self.log_output)
-
-        self.setLayout(main_layout)
-
-        self.input_path_edit.textChanged.connect(self.update_input_format)
-
-        self.output_path_edit.textChanged.connect(self.update_output_format)
-
-    def update_input_format(self):
-        file_path = self.input_path_edit.text()
-        _, ext = os.path.splitext(file_path)
-        ext = ext[1:].lower()
-        if ext == 'yml':
-            ext = 'yaml'
-
-        index = self.input_format_combo.findText(ext)
-        if index >= 0:
-            self.input_format_combo.setCurrentIndex(index)
-
-    def update_output_format(self):
-        file_path = self.output_path_edit.text()
-        _, ext = os.path.splitext(file_path)
-        ext = ext[1:].lower()
-        if ext == 'yml':
-            ext = 'yaml'
-
-        index = self.output_format_combo.findText(ext)
-        if index >= 0:
-            self.output_format_combo.setCurrentIndex(index)
-
-    def browse_input_file(self):
-        file_name, _ = QFileDialog.getOpenFileName(self, "Wybierz plik wejściowy", "", "Wszystkie pliki (*);;JSON pliki (*.json);;XML pliki (*.xml);;YAML pliki (*.yaml *.yml)")
-        if file_name:
-            self.input_path_edit.setText(file_name)
-
-    def browse_output_file(self):
-        file_name, _ = QFileDialog.getSaveFileName(self, "Zapisz plik wyjściowy jako", "", "Wszystkie pliki (*);;JSON pliki (*.json);;XML pliki (*.xml);;YAML pliki (*.yaml *.yml)")
-        if file_name:
-            self.output_path_edit.setText(file_name)
-
-    def log_message(self, message):
-        self.log_output.append(message)
-        QApplication.processEvents() 
-
-    def perform_conversion(self):
-        self.log_output.clear()
-        self.log_message("Rozpoczynanie konwersji...")
-
-        input_path = self.input_path_edit.text()
-        output_path = self.output_path_edit.text()
-        input_format = self.input_format_combo.currentText()
-        output_format = self.output_format_combo.currentText()
-
-        if not input_path or not output_path:
-            QMessageBox.warning(self, "Błąd", "Proszę podać ścieżki do obu plików (wejściowego i wyjściowego).")
-            self.log_message("Błąd: Nie podano wszystkich ścieżek.")
+            result = {"success": False, "skipped": False, "seconds": 0.0, "bytes_in": 0, "log": f"{e}\n"}
+        key = manifest_key(self.output_dir, job['output_path'])
+        if result['success']:
+            self.manifest[key] = manifest_entry(job, result['input_signature'])
+        else:
+            self.manifest.pop(key, None)
+        if result['skipped']:
+            self.log(f"[AKT] {path} -> {job['output_path']} (treść bez zmian, opóźnienie {latency:.2f} s)")
             return
+        status = "OK " if result['success'] else "BŁĄD"
+        self.log(f"[{status}] {path} -> {job['output_path']} "
+                 f"(opóźnienie {latency:.2f} s, konwersja {result['seconds']:.3f} s, {_format_size(result['bytes_in'])})")
+        if result['success']:
+            self.converted += 1
+        else:
+            self.failed += 1
+            for line in result['log'].strip().splitlines():
+                print(f"        {line}")
 
-        if not os.path.exists(input_path):
-            QMessageBox.warning(self, "Błąd", f"Plik wejściowy '{input_path}' nie istnieje.")
-            self.log_message(f"Błąd: Plik wejściowy '{input_path}' nie istnieje.")
-            return
+    def log(self, message):
+        print(f"{time.strftime('%H:%M:%S')} {message}", flush=True)
 
-        self.log_message(f"  Plik wejściowy: {input_path} (Format: {input_format})")
-        self.log_message(f"  Plik wyjściowy: {output_path} (Format: {output_format})")
+    def run(self):
+        import concurrent.futures
+        import signal
+
+        def stop(signum, frame):
+            raise KeyboardInterrupt()
+
+        signal.signal(signal.SIGTERM, stop)
+        print(f"Obserwowanie katalogów: {', '.join(self.roots)} -> {self.output_dir} "
+              f"(format: {self.output_format}, procesy: {self.jobs}, skanowanie co {self.interval:g} s, "
+              f"zwłoka {self.debounce:g} s). Ctrl+C kończy.", flush=True)
+        executor = concurrent.futures.ProcessPoolExecutor(max_workers=self.jobs, initializer=_warm_worker)
+        try:
+            now = self.scan(initial=True)
+            while True:
+                self.submit_ready(executor, now)
+                next_scan = now + self.interval
+                while True:
+                    timeout = next_scan - time.monotonic()
+                    if timeout <= 0:
+                        break
+                    if not self.in_flight:
+                        time.sleep(timeout)
+                        break
+                    done, _ = concurrent.futures.wait(
+                        list(self.in_flight), timeout=timeout, return_when=concurrent.futures.FIRST_COMPLETED
+                    )
+                    for future in done:
+                        self.finish(future)
+                    if done:
+                        save_manifest(self.output_dir, self.manifest)
+                        if self.cache is not None:
+                            prune_cache(ConversionCache(**self.cache))
+                now = self.scan()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+            for future in [future for future in self.in_flight if future.done() and not future.cancelled()]:
+                self.finish(future)
+            save_manifest(self.output_dir, self.manifest)
+        print(f"\nZakończono obserwowanie. Skonwertowano: {self.converted}, błędy: {self.failed}.")
+        return True
 
-    
-        self.convert_btn.setEnabled(False)
-        self.convert_btn.setText("Konwertuję...")
+def watch_main(argv):
+    parser = argparse.ArgumentParser(
+        prog="program.py watch",
+        description="Obserwuje katalogi wejściowe i automatycznie konwertuje nowe lub zmienione pliki "
+                    "do lustrzanego drzewa katalogu wyjściowego.",
+    )
+    parser.add_argument("dirs", nargs='+', metavar="KATALOG", help="Katalogi wejściowe do obserwowania.")
+    parser.add_argument("--output-dir", required=True, help="Katalog wyjściowy (lustrzane drzewo katalogów wejściowych).")
+    parser.add_argument(
+        "--to",
+        dest="target_format",
+        required=True,
+        type=str.lower,
+        choices=format_names() + [ext for ext in format_extensions() if ext not in FORMATS],
+        help="Format docelowy (np. json, yaml)."
+    )
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                        help="Liczba stale działających procesów roboczych (domyślnie: liczba rdzeni).")
+    parser.add_argument("--interval", type=float, default=WATCH_INTERVAL,
+                        help=f"Odstęp między skanowaniami katalogów w sekundach (domyślnie: {WATCH_INTERVAL:g}).")
+    parser.add_argument("--debounce", type=float, default=WATCH_DEBOUNCE,
+                        help="Plik jest konwertowany dopiero, gdy jego rozmiar i czas modyfikacji nie zmieniły się "
+                             f"przez tyle sekund (domyślnie: {WATCH_DEBOUNCE:g}).")
+    parser.add_argument("--stream", action="store_true", help="Konwertuj strumieniowo, rekord po rekordzie.")
+    parser.add_argument("--yaml-documents", action="store_true",
+                        help="W trybie strumieniowym zapisuj każdy rekord jako osobny dokument YAML (---).")
+    parser.add_argument("--cache", action="store_true", help="Używaj pamięci podręcznej wyników (jak w trybie konwersji).")
+    parser.add_argument("--cache-dir", metavar="KATALOG", help="Katalog pamięci podręcznej (włącza --cache).")
+    parser.add_argument("--cache-size", type=parse_size, default=CACHE_MAX_SIZE, metavar="ROZMIAR",
+                        help="Limit rozmiaru pamięci podręcznej (domyślnie: 1GB).")
+    args = parser.parse_args(argv)
+
+    for directory in args.dirs:
+        if not os.path.isdir(directory):
+            parser.error(f"Błąd: Katalog wejściowy '{directory}' nie istnieje.")
+    if args.jobs < 1:
+        parser.error("Błąd: Liczba procesów (--jobs) musi być dodatnia.")
+    if args.interval <= 0 or args.debounce < 0:
+        parser.error("Błąd: Odstęp skanowania musi być dodatni, a zwłoka nieujemna.")
+
+    cache = None
+    if args.cache or args.cache_dir:
+        cache = {"directory": args.cache_dir, "max_size": args.cache_size, "link": False}
+    watcher = FolderWatcher(
+        args.dirs,
+        args.output_dir,
+        normalize_format(args.target_format),
+        jobs=args.jobs,
+        interval=args.interval,
+        debounce=args.debounce,
+        stream=args.stream,
+        yaml_documents=args.yaml_documents,
+        cache=cache
+    )
+    return 0 if watcher.run() else 1
 
-        self.worker = ConverterWorker(input_path, input_format, output_path, output_format)
-        self.worker.finished.connect(self.on_conversion_finished)
-        self.worker.progress.connect(self.log_message) 
-        self.worker.start() 
+def write_stats_report(report, destination):
+    text = json.dumps(report, indent=4, ensure_ascii=False)
+    if destination == '-':
+        print(text, file=sys.stderr)
+    else:
+        with open(destination, 'w', encoding='utf-8') as f:
+            f.write(text)
+        print(f"Raport statystyk zapisano do pliku: '{destination}'.")
+
+PROFILE_SAMPLE_INTERVAL = 0.001
+
+def _frame_label(frame):
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+def _sample_stacks(thread_id, counts, stop, interval):
+    while not stop.wait(interval):
+        frame = sys._current_frames().get(thread_id)
+        stack = []
+        while frame is not None:
+            stack.append(_frame_label(frame))
+            frame = frame.f_back
+        if stack:
+            key = ";".join(reversed(stack))
+            counts[key] = counts.get(key, 0) + 1
+
+def profile_call(func, prefix, top=25, interval=PROFILE_SAMPLE_INTERVAL):
+    import cProfile
+    import pstats
+    import threading
+
+    counts = {}
+    stop = threading.Event()
+    sampler = threading.Thread(
+        target=_sample_stacks,
+        args=(threading.get_ident(), counts, stop, interval),
+        daemon=True
+    )
+    profiler = cProfile.Profile()
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(min(switch_interval, interval))
+    sampler.start()
+    try:
+        result = profiler.runcall(func)
+    finally:
+        stop.set()
+        sampler.join()
+        sys.setswitchinterval(switch_interval)
+
+    pstats_path = prefix + '.pstats'
+    collapsed_path = prefix + '.collapsed'
+    profiler.dump_stats(pstats_path)
+    with open(collapsed_path, 'w', encoding='utf-8') as f:
+        for stack, count in sorted(counts.items()):
+            f.write(f"{stack} {count}\n")
+
+    print(f"\nNajkosztowniejsze funkcje (czas łączny, top {top}):")
+    pstats.Stats(profiler, stream=sys.stdout).sort_stats('cumulative').print_stats(top)
+    print(f"Profil cProfile zapisano do pliku: '{pstats_path}' (np. python -m pstats, snakeviz).")
+    print(f"Stosy do flame graph ({sum(counts.values())} próbek co {interval * 1000:.0f} ms) zapisano do pliku: "
+          f"'{collapsed_path}' (np. flamegraph.pl, speedscope).")
+    return result
 
-    def on_conversion_finished(self, success, message):
-        self.convert_btn.setEnabled(True) 
-        self.convert_btn.setText("Konwertuj")
+BENCHMARK_SHAPES = ['flat', 'deep', 'wide', 'text']
+BENCHMARK_DEPTH = 64
+BENCHMARK_WIDTH = 200
+_SIZE_UNITS = {'B': 1, 'KB': 1024, 'MB': 1024 ** 2, 'GB': 1024 ** 3}
+
+def parse_size(text):
+    match = re.fullmatch(r'\s*(\d+(?:\.\d+)?)\s*([KMG]?B)?\s*', text.upper())
+    if not match:
+        raise argparse.ArgumentTypeError(f"Nieprawidłowy rozmiar: '{text}' (np. 1KB, 10MB, 1GB).")
+    return int(float(match.group(1)) * _SIZE_UNITS[match.group(2) or 'B'])
+
+def benchmark_record(shape, index):
+    if shape == 'flat':
+        return {
+            "id": index,
+            "name": f"Produkt {index}",
+            "price": round(index * 0.37 % 1000, 2),
+            "available": index % 3 != 0,
+            "tags": ["elektronika", "nowosc"]
+        }
+    if shape == 'deep':
+        record = {"value": index}
+        for _ in range(BENCHMARK_DEPTH):
+            record = {"level": record}
+        return record
+    if shape == 'wide':
+        return {f"field_{k:03d}": index + k if k % 2 else f"wartosc {k}" for k in range(BENCHMARK_WIDTH)}
+    if shape == 'text':
+        return {"id": index, "text": "Zażółć gęślą jaźń & <znaczniki> \"cytaty\". " * 100}
+    raise ValueError(f"Nieznany kształt danych: {shape}")
+
+def generate_benchmark_records(shape, target_bytes):
+    record_size = len(json.dumps(benchmark_record(shape, 0), indent=4, ensure_ascii=False).encode('utf-8'))
+    count = max(1, target_bytes // record_size)
+    return ((None, benchmark_record(shape, index)) for index in range(count))
+
+def run_benchmark_case(input_path, input_format, output_path, output_format, stream, measure_memory):
+    import tracemalloc
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        success = run_conversion(input_path, input_format, output_path, output_format, stream=stream)
+        seconds = time.perf_counter() - start
+        peak = None
+        if success and measure_memory:
+            tracemalloc.start()
+            try:
+                run_conversion(input_path, input_format, output_path, output_format, stream=stream)
+                peak = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+    return success, seconds, peak
+
+def run_benchmarks(sizes, shapes, input_formats, output_formats, stream=False, measure_memory=True, work_dir=None):
+    import tempfile
+    results = []
+    with tempfile.TemporaryDirectory(dir=work_dir) as tmp:
+        for shape in shapes:
+            for size in sizes:
+                for input_format in input_formats:
+                    input_path = os.path.join(tmp, f"{shape}_{size}.{input_format}")
+                    stream_writer = get_format(input_format).backend('stream_writer')
+                    records = generate_benchmark_records(shape, size)
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        if stream_writer is not None:
+                            stream_writer(records, input_path)
+                        else:
+                            write_stream(records, input_path, input_format)
+                    bytes_in = os.path.getsize(input_path)
+                    for output_format in output_formats:
+                        output_path = os.path.join(tmp, f"out.{output_format}")
+                        case_stream = stream or stream_required(input_format, output_format)
+                        success, seconds, peak = run_benchmark_case(
+                            input_path, input_format, output_path, output_format, case_stream, measure_memory
+                        )
+                        result = {
+                            "shape": shape,
+                            "size": size,
+                            "input_format": input_format,
+                            "output_format": output_format,
+                            "stream": case_stream,
+                            "success": success,
+                            "bytes_in": bytes_in,
+                            "bytes_out": os.path.getsize(output_path) if success else 0,
+                            "seconds": seconds,
+                            "mb_per_s": bytes_in / seconds / (1024 * 1024) if seconds else None,
+                            "peak_memory_bytes": peak
+                        }
+                        results.append(result)
+                        print_benchmark_row(result)
+                        if success:
+                            os.remove(output_path)
+                    os.remove(input_path)
+    return results
+
+def print_benchmark_header():
+    print(f"{'kształt':<7} {'rozmiar':>9} {'konwersja':<13} {'wejście':>10} {'czas [s]':>9} {'MB/s':>8} {'pamięć':>10}")
+
+def print_benchmark_row(result):
+    pair = f"{result['input_format']}->{result['output_format']}"
+    if not result['success']:
+        print(f"{result['shape']:<7} {_format_size(result['size']):>9} {pair:<13} {'BŁĄD':>10}")
+        return
+    peak = _format_size(result['peak_memory_bytes']) if result['peak_memory_bytes'] is not None else '-'
+    print(f"{result['shape']:<7} {_format_size(result['size']):>9} {pair:<13} {_format_size(result['bytes_in']):>10} "
+          f"{result['seconds']:>9.3f} {result['mb_per_s']:>8.2f} {peak:>10}")
+
+def benchmark_main(argv):
+    parser = argparse.ArgumentParser(
+        prog="program.py bench",
+        description="Mierzy wydajność konwersji dla wszystkich par formatów na syntetycznych danych.",
+    )
+    parser.add_argument(
+        "--sizes",
+        type=lambda text: [parse_size(part) for part in text.split(',')],
+        default=[parse_size(size) for size in ('1KB', '1MB', '10MB')],
+        help="Docelowe rozmiary dokumentów (JSON), oddzielone przecinkami, od 1KB do 1GB (domyślnie: 1KB,1MB,10MB)."
+    )
+    parser.add_argument(
+        "--shapes",
+        type=lambda text: text.split(','),
+        default=BENCHMARK_SHAPES,
+        help=f"Kształty danych: {', '.join(BENCHMARK_SHAPES)} (domyślnie wszystkie)."
+    )
+    parser.add_argument(
+        "--from",
+        dest="input_formats",
+        type=lambda text: text.split(','),
+        default=format_names(),
+        help="Formaty wejściowe, oddzielone przecinkami (domyślnie wszystkie)."
+    )
+    parser.add_argument(
+        "--to",
+        dest="output_formats",
+        type=lambda text: text.split(','),
+        default=format_names(),
+        help="Formaty wyjściowe, oddzielone przecinkami (domyślnie wszystkie)."
+    )
+    parser.add_argument("--stream", action="store_true", help="Mierz konwersję strumieniową zamiast wczytywania całego dokumentu.")
+    parser.add_argument("--no-memory", action="store_true", help="Pomiń pomiar szczytowego zużycia pamięci (tracemalloc).")
+    parser.add_argument("--work-dir", help="Katalog na pliki tymczasowe (domyślnie systemowy).")
+    parser.add_argument("--json", dest="json_path", help="Zapisz wyniki do pliku JSON.")
+    args = parser.parse_args(argv)
+
+    for shape in args.shapes:
+        if shape not in BENCHMARK_SHAPES:
+            parser.error(f"Błąd: Nieznany kształt danych: '{shape}'.")
+    for file_format in args.input_formats + args.output_formats:
+        if file_format not in FORMATS:
+            parser.error(f"Błąd: Nieobsługiwany format: '{file_format}'.")
+
+    print_benchmark_header()
+    results = run_benchmarks(
+        args.sizes, args.shapes, args.input_formats, args.output_formats,
+        stream=args.stream, measure_memory=not args.no_memory, work_dir=args.work_dir
+    )
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump({"yaml_backend": yaml_backend_name(), "results": results}, f, indent=4, ensure_ascii=False)
+        print(f"\nWyniki zapisano do pliku JSON: '{args.json_path}'.")
+    return 0 if all(result['success'] for result in results) else 1
+
+def prune_cache(cache, max_size=None):
+    removed, freed = cache.prune(max_size)
+    if removed:
+        print(f"Pamięć podręczna: usunięto {removed} najdawniej używanych wpisów ({_format_size(freed)}).")
+    return removed, freed
+
+def cache_main(argv):
+    parser = argparse.ArgumentParser(
+        prog="program.py cache",
+        description="Przegląda i porządkuje pamięć podręczną wyników konwersji.",
+    )
+    parser.add_argument("--dir", dest="directory", help=f"Katalog pamięci podręcznej (domyślnie: {default_cache_dir()}).")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("stats", help="Pokaż liczbę wpisów i łączny rozmiar.")
+    list_parser = commands.add_parser("list", help="Wypisz wpisy od najdawniej używanych.")
+    list_parser.add_argument("-n", "--limit", type=int, help="Pokaż tylko N ostatnio używanych wpisów.")
+    prune_parser = commands.add_parser("prune", help="Usuń najdawniej używane wpisy ponad limit rozmiaru.")
+    prune_parser.add_argument(
+        "--max-size",
+        type=parse_size,
+        default=CACHE_MAX_SIZE,
+        metavar="ROZMIAR",
+        help="Docelowy maksymalny rozmiar (domyślnie: 1GB; 0 usuwa wszystko)."
+    )
+    commands.add_parser("clear", help="Usuń wszystkie wpisy.")
+    args = parser.parse_args(argv)
+
+    cache = ConversionCache(args.directory)
+    if args.command == 'stats':
+        entries = cache.entries()
+        print(f"Katalog: {cache.directory}")
+        print(f"Wpisy: {len(entries)}, łączny rozmiar: {_format_size(sum(entry['size'] for entry in entries))}")
+        if entries:
+            print(f"Najdawniej używany: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(entries[0]['last_used']))}, "
+                  f"ostatnio używany: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(entries[-1]['last_used']))}")
+    elif args.command == 'list':
+        entries = cache.entries()
+        if args.limit is not None:
+            entries = entries[-args.limit:] if args.limit > 0 else []
+        print(f"{'Klucz':<14}{'Rozmiar':>12}  {'Ostatnio użyty':<21}{'Formaty':<14}Źródło")
+        for entry in entries:
+            meta = cache.metadata(entry)
+            formats = f"{meta.get('input_format', '?')}->{meta.get('output_format', '?')}"
+            print(f"{entry['key'][:12]:<14}{_format_size(entry['size']):>12}  "
+                  f"{time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(entry['last_used'])):<21}"
+                  f"{formats:<14}{meta.get('source', '')}")
+    elif args.command == 'prune':
+        removed, freed = cache.prune(args.max_size)
+        print(f"Usunięto wpisów: {removed} ({_format_size(freed)}).")
+    elif args.command == 'clear':
+        removed, freed = cache.clear()
+        print(f"Usunięto wpisów: {removed} ({_format_size(freed)}).")
+    return 0
 
-        self.log_message(message)
-        if success:
-            QMessageBox.information(self, "Sukces", message)
-        else:
-            QMessageBox.critical(self, "Błąd Konwersji", message)
-      
 if __name__ == '__main__':
+    if getattr(sys, 'frozen', False):
+        import multiprocessing
+        multiprocessing.freeze_support()
     if len(sys.argv) > 1:
         try:
+            if sys.argv[1] == 'bench':
+                sys.exit(benchmark_main(sys.argv[2:]))
+            if sys.argv[1] == 'cache':
+                sys.exit(cache_main(sys.argv[2:]))
+            if sys.argv[1] == 'watch':
+                sys.exit(watch_main(sys.argv[2:]))
+            if sys.argv[1] == 'serve':
+                from server import serve_main
+                sys.exit(serve_main(sys.argv[2:]))
+
             parsed_args = parse_arguments() 
+            if parsed_args['batch']:
+                sys.exit(0 if run_batch(parsed_args) else 1)
+
             print(f"Pomyślnie sparsowano argumenty:")
             print(f"  Plik wejściowy: {parsed_args['input_path']} (Format: {parsed_args['input_format']})")
             print(f"  Plik wyjściowy: {parsed_args['output_path']} (Format: {parsed_args['output_format']})")
 
-            print("\nRozpoczynanie wczytywania i walidacji pliku wejściowego...")
-            input_data = read_and_validate_data(
-                parsed_args['input_path'],
-                parsed_args['input_format']
-            )
-
-            if input_data is None:
-                print("Błąd: Nie udało się wczytać lub zweryfikować pliku wejściowego. Program zostanie zakończony.")
-                sys.exit(1)
-
-            data_for_conversion = None
-            if parsed_args['input_format'] == 'xml':
-                if isinstance(input_data, ET.Element):
-                    print("  Konwersja XML (ElementTree) na słownik/listę Pythona...")
-                    data_for_conversion = convert_xml_to_dict(input_data)
-                    if data_for_conversion is None:
-                        print("Błąd: Konwersja XML na słownik Pythona nie powiodła się.")
-                        sys.exit(1)
-                else:
-                    print(f"Błąd wewnętrzny: Oczekiwano obiektu ElementTree dla formatu XML, otrzymano {type(input_data)}.")
-                    sys.exit(1)
-            elif parsed_args['input_format'] in ['json', 'yaml']:
-                data_for_conversion = input_data
-                print(f"  Dane wejściowe są już w formie słownika/listy Pythona (z {parsed_args['input_format'].upper()}).")
+            cache = ConversionCache(**parsed_args['cache']) if parsed_args['cache'] else None
+            stats = None
+            if parsed_args['stats'] is not None:
+                stats = ConversionStats(parsed_args['input_path'], parsed_args['output_path'])
+                stats.start()
+
+            def conversion():
+                return run_conversion(
+                    parsed_args['input_path'],
+                    parsed_args['input_format'],
+                    parsed_args['output_path'],
+                    parsed_args['output_format'],
+                    stream=parsed_args['stream'],
+                    yaml_documents=parsed_args['yaml_documents'],
+                    stats=stats,
+                    parallel=parsed_args['parallel'],
+                    jobs=parsed_args['jobs'],
+                    shard_size=parsed_args['shard_size'],
+                    cache=cache
+                )
+
+            if parsed_args['profile'] is not None:
+                write_success = profile_call(conversion, parsed_args['profile'], top=parsed_args['profile_top'])
             else:
-                print(f"Błąd wewnętrzny: Nieznany format wejściowy do konwersji: {parsed_args['input_format']}.")
-                sys.exit(1)
+                write_success = conversion()
+            if cache is not None and write_success:
+                prune_cache(cache)
 
-            write_success = False
-            if parsed_args['output_format'] == 'json':
-                print("\nRozpoczynanie zapisu danych do pliku JSON...")
-                write_success = write_data_to_json(data_for_conversion, parsed_args['output_path'])
-            elif parsed_args['output_format'] == 'xml':
-                print("\nRozpoczynanie zapisu danych do pliku XML...")
-                write_success = write_data_to_xml(data_for_conversion, parsed_args['output_path'])
-            elif parsed_args['output_format'] == 'yaml':
-                print("\nRozpoczynanie zapisu danych do pliku YAML...")
-                write_success = write_data_to_yaml(data_for_conversion, parsed_args['output_path'])
-            else:
-                print(f"Błąd wewnętrzny: Nieznany format wyjściowy do zapisu: {parsed_args['output_format']}.")
-                sys.exit(1)
+            if stats is not None:
+                stats.finish(write_success)
+                print("\n" + stats.summary())
+                write_stats_report(stats.to_dict(), parsed_args['stats'])
 
             if write_success:
                 print("\nProgram zakończył działanie pomyślnie.")
                 sys.exit(0)
             else:
-                print("\nProgram zakończył działanie z błędami podczas zapisu.")
+                print("\nProgram zakończył działanie z błędami podczas konwersji.")
                 sys.exit(1)
 
         except SystemExit as e:
@@ -505,7 +3083,5 @@ if __name__ == '__main__':
             traceback.print_exc()
             sys.exit(1)
     else: 
-        app = QApplication(sys.argv)
-        window = DataConverterApp()
-        window.show()
-        sys.exit(app.exec())
\ No newline at end of file
+        from gui import run_gui
+        sys.exit(run_gui())
\ No newline at end of file
@@ -0,0 +1,440 @@
+import argparse
+import http.client
+import http.server
+import io
+import json
+import os
+import shutil
+import signal
+import socket
+import socketserver
+import sys
+import tempfile
+import time
+import traceback
+import urllib.parse
+
+from program import (
+    CONVERTER_VERSION,
+    FORMATS,
+    READ_CHUNK_SIZE,
+    SNIFF_SIZE,
+    convert,
+    get_format,
+    normalize_format,
+    parse_size,
+    preload_engines,
+    sniff_format,
+)
+
+SERVE_HOST = '127.0.0.1'
+SERVE_PORT = 8750
+SERVE_MAX_BODY = 256 * 1024 ** 2
+SERVE_BACKLOG = 128
+SERVE_MAX_LINE = 64 * 1024
+SERVE_SPOOL_SIZE = 8 * 1024 ** 2
+SERVE_RESTART_LIMIT = 5
+SERVE_RESTART_WINDOW = 60.0
+SERVE_RESTART_DELAY = 0.1
+
+class RequestBodyError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+class _RequestBody(io.RawIOBase):
+    def __init__(self, rfile, length=None, limit=SERVE_MAX_BODY):
+        self.rfile = rfile
+        self.chunked = length is None
+        self.remaining = 0 if self.chunked else length
+        self.limit = limit
+        self.total = 0
+        self.finished = length == 0
+
+    def readable(self):
+        return True
+
+    def _next_chunk(self):
+        field = self.rfile.readline(SERVE_MAX_LINE).split(b';', 1)[0].strip()
+        try:
+            size = int(field, 16) if field.isalnum() else -1
+        except ValueError:
+            size = -1
+        if size < 0:
+            raise RequestBodyError(400, "Nieprawidłowy nagłówek fragmentu w treści żądania (chunked).")
+        if size == 0:
+            while self.rfile.readline(SERVE_MAX_LINE) not in (b'\r\n', b'\n', b''):
+                pass
+            self.finished = True
+        self.remaining = size
+
+    def readinto(self, buffer):
+        if self.finished:
+            return 0
+        if self.chunked and self.remaining == 0:
+            self._next_chunk()
+            if self.finished:
+                return 0
+        data = self.rfile.read(min(len(buffer), self.remaining))
+        if not data:
+            raise RequestBodyError(400, "Treść żądania została przerwana przed końcem.")
+        self.total += len(data)
+        if self.total > self.limit:
+            raise RequestBodyError(413, f"Treść żądania przekracza limit {self.limit} bajtów.")
+        buffer[:len(data)] = data
+        self.remaining -= len(data)
+        if self.remaining == 0:
+            if self.chunked:
+                self.rfile.readline(SERVE_MAX_LINE)
+            else:
+                self.finished = True
+        return len(data)
+
+    def drain(self):
+        buffer = bytearray(READ_CHUNK_SIZE)
+        while self.readinto(buffer):
+            pass
+
+class _ResponseStream:
+    def __init__(self, handler, body, headers, buffered=False):
+        self.handler = handler
+        self.body = body
+        self.headers = headers
+        self.chunked = handler.request_version != 'HTTP/1.0'
+        self.buffered = buffered
+        self.started = False
+        self.spool = None
+
+    def _send(self, payload):
+        if self.spool is not None and self.body.finished:
+            self.spool.seek(0)
+            shutil.copyfileobj(self.spool, self.handler.wfile, READ_CHUNK_SIZE)
+            self.spool.close()
+            self.spool = None
+        if self.spool is None:
+            if self.body.finished:
+                self.handler.wfile.write(payload)
+                return
+            sent = 0
+            if hasattr(socket, 'MSG_DONTWAIT'):
+                try:
+                    sent = self.handler.connection.send(payload, socket.MSG_DONTWAIT)
+                except BlockingIOError:
+                    pass
+            if sent == len(payload):
+                return
+            payload = memoryview(payload)[sent:]
+            self.spool = tempfile.SpooledTemporaryFile(SERVE_SPOOL_SIZE)
+        self.spool.write(payload)
+
+    def start(self):
+        self.handler.send_response(200)
+        for name, value in self.headers.items():
+            self.handler.send_header(name, value)
+        if self.chunked:
+            self.handler.send_header("Transfer-Encoding", "chunked")
+            self.handler.send_header("Trailer", "Server-Timing")
+        else:
+            self.handler.send_header("Connection", "close")
+            self.handler.close_connection = True
+        self.handler.end_headers()
+        self.started = True
+
+    def write(self, data):
+        if not data:
+            return 0
+        if self.buffered:
+            if self.spool is None:
+                self.spool = tempfile.SpooledTemporaryFile(SERVE_SPOOL_SIZE)
+            self.spool.write(data)
+            return len(data)
+        if not self.started:
+            self.start()
+        if self.chunked:
+            self._send(b"%x\r\n" % len(data) + bytes(data) + b"\r\n")
+        else:
+            self._send(bytes(data))
+        return len(data)
+
+    def finish(self, trailers):
+        if self.buffered:
+            self.handler.send_response(200)
+            for name, value in {**self.headers, **trailers}.items():
+                self.handler.send_header(name, value)
+            self.handler.send_header("Content-Length", str(self.spool.tell() if self.spool is not None else 0))
+            self.handler.end_headers()
+            self.started = True
+            if self.spool is not None:
+                self.spool.seek(0)
+                shutil.copyfileobj(self.spool, self.handler.wfile, READ_CHUNK_SIZE)
+                self.close()
+            return
+        if not self.started:
+            self.start()
+        if self.chunked:
+            lines = "".join(f"{name}: {value}\r\n" for name, value in trailers.items())
+            self._send(b"0\r\n" + lines.encode('latin-1') + b"\r\n")
+        else:
+            self._send(b"")
+
+    def close(self):
+        if self.spool is not None:
+            self.spool.close()
+            self.spool = None
+
+class ConversionRequestHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = f"DataConverter/{CONVERTER_VERSION}"
+
+    def address_string(self):
+        return self.client_address[0] if isinstance(self.client_address, tuple) else "unix"
+
+    def log_message(self, format, *args):
+        print(f"[{os.getpid()}] {self.address_string()} {format % args}", flush=True)
+
+    def send_text(self, status, text, close=False):
+        body = text.encode('utf-8')
+        self.send_response(status)
+        self.send_header("Content-Type", "text/plain; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        if close:
+            self.send_header("Connection", "close")
+            self.close_connection = True
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        path = urllib.parse.urlsplit(self.path).path
+        if path == '/health':
+            self.send_text(200, "OK\n")
+        elif path == '/formats':
+            body = json.dumps({
+                spec.name: {"label": spec.label, "extensions": list(spec.extensions), "content_type": spec.content_type}
+                for spec in FORMATS.values()
+            }, ensure_ascii=False).encode('utf-8')
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        else:
+            self.send_text(404, f"Nie znaleziono: {path}\n")
+
+    def do_POST(self):
+        url = urllib.parse.urlsplit(self.path)
+        if url.path != '/convert':
+            self.send_text(404, f"Nie znaleziono: {url.path}\n", close=True)
+            return
+        query = urllib.parse.parse_qs(url.query)
+        input_format = query.get('from', [None])[0]
+        output_format = query.get('to', [None])[0]
+        stream = query.get('stream', ['0'])[0].lower() in ('1', 'true', 'yes', 'tak')
+        yaml_documents = query.get('yaml_documents', ['0'])[0].lower() in ('1', 'true', 'yes', 'tak')
+        if output_format is None:
+            self.send_text(400, "Błąd: Podaj format docelowy w parametrze 'to'.\n", close=True)
+            return
+        for name in (input_format, output_format):
+            if name is not None and normalize_format(name) is None:
+                self.send_text(400, f"Błąd: Nieobsługiwany format: {name}\n", close=True)
+                return
+
+        transfer_encoding = self.headers.get('Transfer-Encoding', '').lower()
+        length = self.headers.get('Content-Length')
+        if transfer_encoding and transfer_encoding != 'chunked':
+            self.send_text(501, f"Błąd: Nieobsługiwane kodowanie treści: {transfer_encoding}\n", close=True)
+            return
+        if not transfer_encoding:
+            if length is None:
+                self.send_text(411, "Błąd: Wymagany nagłówek Content-Length lub Transfer-Encoding: chunked.\n", close=True)
+                return
+            try:
+                length = int(length)
+            except ValueError:
+                length = -1
+            if length < 0:
+                self.send_text(400, "Błąd: Nieprawidłowy nagłówek Content-Length.\n", close=True)
+                return
+            if length > self.server.max_body:
+                self.send_text(413, f"Błąd: Treść żądania przekracza limit {self.server.max_body} bajtów.\n", close=True)
+                return
+        else:
+            length = None
+
+        body = _RequestBody(self.rfile, length, self.server.max_body)
+        source = io.BufferedReader(body, READ_CHUNK_SIZE)
+        response = None
+        start = time.perf_counter()
+        try:
+            if input_format is None:
+                input_format = sniff_format(source.peek(SNIFF_SIZE)[:SNIFF_SIZE])
+            input_spec = get_format(input_format)
+            output_spec = get_format(output_format)
+            response = _ResponseStream(self, body, {
+                "Content-Type": output_spec.content_type,
+                "X-Input-Format": input_spec.name,
+                "X-Output-Format": output_spec.name,
+            }, buffered=not stream)
+            convert(source, response, input_format=input_spec.name, output_format=output_spec.name, stream=stream,
+                    yaml_documents=yaml_documents)
+            body.drain()
+        except Exception as e:
+            if response is not None:
+                response.close()
+            if response is not None and response.started:
+                self.log_message("Przerwano odpowiedź w trakcie konwersji: %s", e)
+                self.close_connection = True
+                return
+            if isinstance(e, RequestBodyError):
+                self.send_text(e.status, f"Błąd: {e}\n", close=True)
+            else:
+                self.send_text(422, f"Błąd konwersji: {e}\n", close=not body.finished)
+            return
+        response.finish({"Server-Timing": f"convert;dur={(time.perf_counter() - start) * 1000:.1f}"})
+
+class ConversionServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    daemon_threads = True
+
+    def __init__(self, listener, handler_class, max_body=SERVE_MAX_BODY):
+        super().__init__(listener.getsockname(), handler_class, bind_and_activate=False)
+        self.socket.close()
+        self.socket = listener
+        self.max_body = max_body
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, socket_path, timeout=socket._GLOBAL_DEFAULT_TIMEOUT):
+        super().__init__('localhost', timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        if self.timeout is not socket._GLOBAL_DEFAULT_TIMEOUT:
+            sock.settimeout(self.timeout)
+        sock.connect(self.socket_path)
+        self.sock = sock
+
+def create_listener(host=SERVE_HOST, port=SERVE_PORT, socket_path=None, backlog=SERVE_BACKLOG):
+    if socket_path is None:
+        return socket.create_server((host, port), backlog=backlog)
+    if os.path.exists(socket_path):
+        os.remove(socket_path)
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(socket_path)
+    listener.listen(backlog)
+    return listener
+
+def serve_worker(listener, max_body=SERVE_MAX_BODY):
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    ConversionServer(listener, ConversionRequestHandler, max_body=max_body).serve_forever()
+
+def run_server(host=SERVE_HOST, port=SERVE_PORT, socket_path=None, workers=1, max_body=SERVE_MAX_BODY):
+    preload_engines()
+    listener = create_listener(host, port, socket_path)
+    address = socket_path if socket_path is not None else "http://%s:%d" % listener.getsockname()[:2]
+
+    if not hasattr(os, 'fork'):
+        print(f"Serwer konwersji nasłuchuje na {address} (jeden proces, brak os.fork). Ctrl+C kończy.", flush=True)
+        server = ConversionServer(listener, ConversionRequestHandler, max_body=max_body)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+        print("\nZatrzymano serwer.")
+        return True
+
+    def stop(signum, frame):
+        raise KeyboardInterrupt()
+
+    def spawn():
+        signals = {signal.SIGINT, signal.SIGTERM}
+        signal.pthread_sigmask(signal.SIG_BLOCK, signals)
+        try:
+            pid = os.fork()
+            if pid == 0:
+                code = 1
+                try:
+                    signal.signal(signal.SIGINT, signal.SIG_IGN)
+                    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+                    signal.pthread_sigmask(signal.SIG_UNBLOCK, signals)
+                    serve_worker(listener, max_body)
+                    code = 0
+                except BaseException:
+                    traceback.print_exc()
+                    sys.stderr.flush()
+                finally:
+                    os._exit(code)
+        finally:
+            signal.pthread_sigmask(signal.SIG_UNBLOCK, signals)
+        children.add(pid)
+
+    children = set()
+    crashes = []
+    success = True
+    signal.signal(signal.SIGTERM, stop)
+    print(f"Serwer konwersji nasłuchuje na {address} (procesy robocze: {workers}). Ctrl+C kończy.", flush=True)
+    try:
+        for _ in range(workers):
+            spawn()
+        while True:
+            pid, status = os.wait()
+            if pid not in children:
+                continue
+            children.discard(pid)
+            now = time.monotonic()
+            crashes = [moment for moment in crashes if now - moment < SERVE_RESTART_WINDOW] + [now]
+            if len(crashes) > SERVE_RESTART_LIMIT:
+                print(f"Błąd: Procesy robocze zakończyły się nieoczekiwanie {len(crashes)} razy w ciągu "
+                      f"{SERVE_RESTART_WINDOW:.0f} s; zatrzymywanie serwera.", flush=True)
+                success = False
+                break
+            delay = SERVE_RESTART_DELAY * 2 ** (len(crashes) - 1)
+            print(f"Proces roboczy {pid} zakończył się nieoczekiwanie (status {status}); uruchamianie nowego "
+                  f"za {delay:.1f} s.", flush=True)
+            time.sleep(delay)
+            spawn()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except OSError:
+                pass
+        for pid in children:
+            try:
+                os.waitpid(pid, 0)
+            except OSError:
+                pass
+        listener.close()
+        if socket_path is not None and os.path.exists(socket_path):
+            os.remove(socket_path)
+    print("\nZatrzymano serwer.")
+    return success
+
+def serve_main(argv):
+    parser = argparse.ArgumentParser(
+        prog="program.py serve",
+        description="Udostępnia konwersję przez HTTP: POST /convert?from=json&to=yaml z danymi w treści żądania "
+                    "(Content-Length lub chunked). Domyślnie dokument jest konwertowany w całości, a odpowiedź "
+                    "wysyłana dopiero po udanej konwersji, więc błąd zawsze kończy się kodem 4xx. stream=1 czyta "
+                    "rekord po rekordzie i przesyła wynik (chunked) w miarę zapisu; błąd wykryty w trakcie przerywa "
+                    "wtedy połączenie. GET /formats zwraca listę formatów, GET /health stan serwera.",
+    )
+    parser.add_argument("--host", default=SERVE_HOST, help=f"Adres nasłuchiwania (domyślnie: {SERVE_HOST}).")
+    parser.add_argument("--port", type=int, default=SERVE_PORT,
+                        help=f"Port nasłuchiwania; 0 wybiera wolny port (domyślnie: {SERVE_PORT}).")
+    parser.add_argument("--socket", dest="socket_path", metavar="ŚCIEŻKA",
+                        help="Nasłuchuj na gnieździe Unix zamiast TCP.")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                        help="Liczba wstępnie uruchomionych procesów roboczych (domyślnie: liczba rdzeni).")
+    parser.add_argument("--max-body", type=parse_size, default=SERVE_MAX_BODY, metavar="ROZMIAR",
+                        help="Maksymalny rozmiar treści żądania (domyślnie: 256MB).")
+    args = parser.parse_args(argv)
+
+    if args.jobs < 1:
+        parser.error("Błąd: Liczba procesów (--jobs) musi być dodatnia.")
+    if args.socket_path is not None and not hasattr(socket, 'AF_UNIX'):
+        parser.error("Błąd: Gniazda Unix nie są dostępne w tym systemie.")
+    return 0 if run_server(args.host, args.port, args.socket_path, args.jobs, args.max_body) else 1
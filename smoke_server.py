@@ -0,0 +1,216 @@
+import argparse
+import http.client
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from program import convert
+from server import UnixHTTPConnection
+
+PROGRAM = os.path.join(os.path.dirname(os.path.abspath(__file__)), "program.py")
+MAX_BODY = 16 * 1024 ** 2
+
+class SmokeTest:
+    def __init__(self, connect):
+        self.connect = connect
+        self.failures = 0
+
+    def check(self, name, condition, detail=""):
+        if condition:
+            print(f"  OK    {name}")
+        else:
+            self.failures += 1
+            print(f"  BŁĄD  {name}: {detail}")
+
+    def request(self, conn, method, path, body=None, headers=None, chunked=False):
+        conn.request(method, path, body, headers or {}, encode_chunked=chunked)
+        response = conn.getresponse()
+        return response, response.read()
+
+    def raw_exchange(self, request):
+        conn = self.connect()
+        conn.connect()
+        try:
+            conn.sock.sendall(request)
+            data = b""
+            while True:
+                chunk = conn.sock.recv(65536)
+                if not chunk:
+                    return data
+                data += chunk
+        finally:
+            conn.close()
+
+    def run(self):
+        self.check_keep_alive()
+        self.check_conversion()
+        self.check_chunked()
+        self.check_client_errors()
+        self.check_conversion_errors()
+        return self.failures
+
+    def check_keep_alive(self):
+        conn = self.connect()
+        response, body = self.request(conn, "GET", "/health")
+        self.check("GET /health", response.status == 200 and body == b"OK\n", f"{response.status} {body!r}")
+        sock = conn.sock
+        response, body = self.request(conn, "GET", "/formats")
+        formats = json.loads(body) if response.status == 200 else {}
+        self.check("GET /formats", {"json", "xml", "yaml", "jsonl"} <= set(formats), f"{response.status} {body[:80]!r}")
+        document = json.dumps([{"id": 1, "name": "Produkt A"}]).encode('utf-8')
+        for index in range(3):
+            response, body = self.request(conn, "POST", "/convert?from=json&to=yaml", document)
+            if response.status != 200:
+                break
+        self.check("keep-alive: kilka żądań w jednym połączeniu", response.status == 200 and conn.sock is sock,
+                   f"status {response.status}, nowe połączenie: {conn.sock is not sock}")
+        conn.close()
+
+    def check_conversion(self):
+        cases = [
+            ("json", "yaml", json.dumps({"name": "x", "tags": ["a", "b"], "empty": {}}).encode('utf-8')),
+            ("xml", "json", b'<config v="3"><name>x</name><port>80</port><item>1</item><item>2</item></config>'),
+            ("json", "yaml", b"{}"),
+            ("yaml", "jsonl", b"- a: 1\n- b: 2\n"),
+        ]
+        conn = self.connect()
+        for input_format, output_format, document in cases:
+            expected = convert(document, input_format=input_format, output_format=output_format).output
+            for stream in ("0", "1"):
+                path = f"/convert?from={input_format}&to={output_format}&stream={stream}"
+                response, body = self.request(conn, "POST", path, document)
+                self.check(f"{input_format} -> {output_format} (stream={stream})",
+                           response.status == 200 and body == expected, f"{response.status} {body[:80]!r}")
+        conn.close()
+
+    def check_chunked(self):
+        document = json.dumps([{"id": index, "name": f"Produkt {index}", "price": index * 0.5}
+                               for index in range(100000)]).encode('utf-8')
+        expected = convert(document, input_format="json", output_format="yaml").output
+        conn = self.connect()
+        parts = (document[start:start + 65536] for start in range(0, len(document), 65536))
+        response, body = self.request(conn, "POST", "/convert?from=json&to=yaml&stream=1", parts, chunked=True)
+        self.check("treść chunked -> odpowiedź chunked (stream=1)",
+                   response.status == 200 and response.getheader("Transfer-Encoding") == "chunked" and body == expected,
+                   f"{response.status} {response.getheader('Transfer-Encoding')} {len(body)} B")
+        parts = (document[start:start + 65536] for start in range(0, len(document), 65536))
+        response, body = self.request(conn, "POST", "/convert?from=json&to=yaml", parts, chunked=True)
+        self.check("treść chunked -> odpowiedź z Content-Length (stream=0)",
+                   response.status == 200 and response.getheader("Content-Length") == str(len(expected))
+                   and body == expected, f"{response.status} {len(body)} B")
+        conn.close()
+
+        reply = self.raw_exchange(b"POST /convert?from=json&to=json&stream=1 HTTP/1.1\r\nHost: localhost\r\n"
+                                  b"Transfer-Encoding: chunked\r\nConnection: close\r\n\r\n"
+                                  b"3\r\n[1,\r\n3\r\n 2]\r\n0\r\n\r\n")
+        self.check("trailer Server-Timing w odpowiedzi chunked",
+                   reply.startswith(b"HTTP/1.1 200") and re.search(rb"\r\n0\r\nServer-Timing: convert;dur=", reply),
+                   repr(reply[-120:]))
+
+    def check_client_errors(self):
+        conn = self.connect()
+        response, _ = self.request(conn, "GET", "/nope")
+        self.check("GET nieznanej ścieżki -> 404", response.status == 404, response.status)
+        response, _ = self.request(conn, "GET", "/health")
+        self.check("keep-alive po 404 dla GET", response.status == 200, response.status)
+        conn.close()
+
+        cases = [
+            ("POST nieznanej ścieżki -> 404", "/nope", 404),
+            ("brak parametru 'to' -> 400", "/convert?from=json", 400),
+            ("nieznany format -> 400", "/convert?from=json&to=csv", 400),
+        ]
+        for name, path, status in cases:
+            reply = self.raw_exchange(b"POST %s HTTP/1.1\r\nHost: localhost\r\nContent-Length: 2\r\n\r\n[]"
+                                      % path.encode('ascii'))
+            self.check(name, reply.startswith(b"HTTP/1.1 %d" % status), repr(reply[:40]))
+
+        reply = self.raw_exchange(b"POST /convert?to=yaml HTTP/1.1\r\nHost: localhost\r\n\r\n")
+        self.check("brak Content-Length -> 411", reply.startswith(b"HTTP/1.1 411"), repr(reply[:40]))
+        reply = self.raw_exchange(b"POST /convert?to=yaml HTTP/1.1\r\nHost: localhost\r\nContent-Length: x\r\n\r\n")
+        self.check("nieprawidłowy Content-Length -> 400", reply.startswith(b"HTTP/1.1 400"), repr(reply[:40]))
+        reply = self.raw_exchange(b"POST /convert?to=yaml HTTP/1.1\r\nHost: localhost\r\nTransfer-Encoding: gzip\r\n\r\n")
+        self.check("nieobsługiwane Transfer-Encoding -> 501", reply.startswith(b"HTTP/1.1 501"), repr(reply[:40]))
+        reply = self.raw_exchange(b"POST /convert?from=json&to=yaml HTTP/1.1\r\nHost: localhost\r\n"
+                                  b"Transfer-Encoding: chunked\r\n\r\nzz\r\n")
+        self.check("nieprawidłowy fragment chunked -> 400", reply.startswith(b"HTTP/1.1 400"), repr(reply[:40]))
+        for size in (b"-1", b"+5", b"1_0", b""):
+            reply = self.raw_exchange(b"POST /convert?from=json&to=yaml HTTP/1.1\r\nHost: localhost\r\n"
+                                      b"Transfer-Encoding: chunked\r\n\r\n" + size + b"\r\n[]\r\n0\r\n\r\n")
+            self.check(f"rozmiar fragmentu {size.decode()!r} -> 400", reply.startswith(b"HTTP/1.1 400"), repr(reply[:40]))
+
+        reply = self.raw_exchange(b"POST /convert?from=json&to=yaml HTTP/1.1\r\nHost: localhost\r\n"
+                                  b"Content-Length: %d\r\n\r\n" % (MAX_BODY + 1))
+        self.check("Content-Length ponad limit -> 413", reply.startswith(b"HTTP/1.1 413"), repr(reply[:40]))
+        reply = self.raw_exchange(b"POST /convert?from=json&to=yaml HTTP/1.1\r\nHost: localhost\r\n"
+                                  b"Transfer-Encoding: chunked\r\n\r\n%x\r\n" % (MAX_BODY + 1) + b" " * (MAX_BODY + 1))
+        self.check("treść chunked ponad limit -> 413", reply.startswith(b"HTTP/1.1 413"), repr(reply[:40]))
+
+    def check_conversion_errors(self):
+        cases = [
+            ("nieprawidłowy JSON", "/convert?from=json&to=yaml", b"[1,"),
+            ("nieprawidłowa nazwa znacznika XML", "/convert?from=json&to=xml&stream=0", b'[{"bad tag": 1}]'),
+            ("niedozwolony znak w XML", "/convert?from=json&to=xml&stream=0", b'[{"a": "\\u0001"}]'),
+            ("nieprawidłowa nazwa znacznika XML (stream=1)", "/convert?from=json&to=xml&stream=1", b'[{"bad tag": 1}]'),
+            ("niedozwolony znak w XML (stream=1)", "/convert?from=json&to=xml&stream=1", b'[{"a": "\\u0001"}]'),
+        ]
+        conn = self.connect()
+        for name, path, document in cases:
+            response, body = self.request(conn, "POST", path, document)
+            self.check(f"{name} -> 422", response.status == 422 and body.startswith("Błąd".encode('utf-8')),
+                       f"{response.status} {body[:80]!r}")
+        response, _ = self.request(conn, "GET", "/health")
+        self.check("keep-alive po błędach 422", response.status == 200, response.status)
+        conn.close()
+
+def start_server(args):
+    process = subprocess.Popen([sys.executable, PROGRAM, "serve", "-j", "2", "--max-body", str(MAX_BODY), *args],
+                               stdout=subprocess.PIPE, text=True, encoding='utf-8')
+    line = process.stdout.readline()
+    if not line:
+        process.wait()
+        raise RuntimeError(f"Serwer nie wystartował (kod {process.returncode}).")
+    threading.Thread(target=process.stdout.read, daemon=True).start()
+    return process, line
+
+def stop_server(process):
+    process.terminate()
+    process.wait(timeout=10)
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Test dymny 'program.py serve': keep-alive, błędy 4xx i treści chunked przez TCP i gniazdo Unix.",
+    )
+    parser.add_argument("--no-unix", action="store_true", help="Pomiń test przez gniazdo Unix.")
+    args = parser.parse_args()
+
+    failures = 0
+    process, line = start_server(["--host", "127.0.0.1", "--port", "0"])
+    try:
+        port = int(re.search(r"http://[^:]+:(\d+)", line).group(1))
+        print(f"TCP (port {port}):")
+        failures += SmokeTest(lambda: http.client.HTTPConnection("127.0.0.1", port, timeout=30)).run()
+    finally:
+        stop_server(process)
+
+    if not args.no_unix and hasattr(os, 'fork'):
+        with tempfile.TemporaryDirectory() as tmp:
+            socket_path = os.path.join(tmp, "convert.sock")
+            process, _ = start_server(["--socket", socket_path])
+            try:
+                print(f"Gniazdo Unix ({socket_path}):")
+                failures += SmokeTest(lambda: UnixHTTPConnection(socket_path, timeout=30)).run()
+            finally:
+                stop_server(process)
+
+    print(f"\nNieudane sprawdzenia: {failures}")
+    sys.exit(1 if failures else 0)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,182 @@
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import program
+from program import convert, format_names
+
+DATASETS = {
+    "lista rekordów": [
+        {"id": 1, "name": "Zażółć & <b> \"cytat\" 'a'", "tags": ["a", "b"], "nested": {"x": None, "y": 1.5, "z": True}},
+        {"id": 2, "name": "", "tags": [], "nested": {}},
+    ],
+    "obiekt": {"name": "cfg", "port": 80, "items": [1, [2, 3], {"a": []}], "empty": {}, "text": " a\"b\\cé\U0001F600 "},
+    "pusta lista": [],
+    "pusty obiekt": {},
+}
+
+XML_DOCUMENTS = (
+    b'<config version="3"><name>x</name><port>80</port><item>1</item><item>2</item><item>3</item></config>',
+    b'<root><a><b>1</b><b>2</b></a><c x="1">tekst</c><d/></root>',
+    b'<?xml version="1.0" encoding="UTF-8"?>\n<root>\n  <item>\xc5\xbc\xc3\xb3\xc5\x82w</item>\n</root>\n',
+    b'<root/>',
+)
+
+class CountingReader(io.RawIOBase):
+    def __init__(self, data, chunk_size=None):
+        self.data = io.BytesIO(data)
+        self.chunk_size = chunk_size
+        self.consumed = 0
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        if self.chunk_size is not None:
+            buffer = memoryview(buffer)[:self.chunk_size]
+        count = self.data.readinto(buffer)
+        self.consumed += count
+        return count
+
+class StreamDocumentEquivalenceTest(unittest.TestCase):
+    def outcome(self, data, input_format, output_format, stream):
+        try:
+            return convert(data, input_format=input_format, output_format=output_format, stream=stream).output
+        except ValueError as e:
+            return type(e).__name__, str(e)
+
+    def assert_modes_match(self, data, input_format):
+        for output_format in format_names():
+            with self.subTest(input_format=input_format, output_format=output_format):
+                self.assertEqual(self.outcome(data, input_format, output_format, True),
+                                 self.outcome(data, input_format, output_format, False))
+
+    def test_every_format_pair(self):
+        for name, value in DATASETS.items():
+            document = json.dumps(value).encode('utf-8')
+            for input_format in format_names():
+                with self.subTest(dataset=name):
+                    data = convert(document, input_format="json", output_format=input_format).output
+                    self.assert_modes_match(data, input_format)
+
+    def test_xml_input(self):
+        for data in XML_DOCUMENTS:
+            self.assert_modes_match(data, "xml")
+
+    def test_explicit_yaml_document_start(self):
+        self.assert_modes_match(b"---\n- id: 1\n  tags: [a, b]\n- id: 2\n", "yaml")
+
+class JsonStreamChunkTest(unittest.TestCase):
+    def records(self, data, chunk_size):
+        return list(program._iter_json_records(CountingReader(data, chunk_size)))
+
+    def test_escapes_and_surrogates_split_across_chunks(self):
+        items = ["\\u0105\\u00e9", "\\ud83d\\ude00", "\\\"\\\\\\/\\b\\f\\n\\r\\t", "zażółć 😀", "1e-5", "-12.5e+3"]
+        array = ("[" + ", ".join(f'"{item}"' for item in items[:-2]) + ", " + ", ".join(items[-2:]) + "]").encode('utf-8')
+        mapping = ("{" + ", ".join(f'"k\\u00f3{index}": "{item}"' for index, item in enumerate(items[:-2])) + "}").encode('utf-8')
+        for data in (array, mapping):
+            expected = json.loads(data)
+            expected = list(expected.items()) if isinstance(expected, dict) else [(None, item) for item in expected]
+            for chunk_size in range(1, 8):
+                with self.subTest(data=data, chunk_size=chunk_size):
+                    self.assertEqual(self.records(data, chunk_size), expected)
+
+    def test_syntax_error_position_spans_chunks(self):
+        data = b'[\n  "a\\u0105",\n  {"b": 1,}\n]'
+        for chunk_size in (1, 3, 5):
+            with self.assertRaises(json.JSONDecodeError) as caught:
+                self.records(data, chunk_size)
+            self.assertEqual(caught.exception.lineno, 3)
+
+class XmlWriterTest(unittest.TestCase):
+    def write(self, writer, *args):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "out.xml")
+            with contextlib.redirect_stdout(io.StringIO()):
+                self.assertTrue(writer(*args, path))
+            with open(path, encoding='utf-8') as f:
+                return f.read()
+
+    def test_matches_write_data_to_xml(self):
+        for name, value in list(DATASETS.items()) + [("wartości proste", [1, "x", None, [], {}])]:
+            with self.subTest(dataset=name):
+                expected = program._xml_tree_pretty_string(program._build_xml_root(value))
+                self.assertEqual(self.write(program.write_data_to_xml, value), expected)
+                self.assertEqual(self.write(program.write_xml_stream, program._iter_data_records(value)), expected)
+
+class ScalarRootTest(unittest.TestCase):
+    def test_jsonl_writes_scalar_root_as_one_line(self):
+        for value, expected in (("str", '"str"\n'), (1, '1\n'), (None, 'null\n'), (True, 'true\n')):
+            output = io.StringIO()
+            program._dump_jsonl(value, output)
+            self.assertEqual(output.getvalue(), expected)
+
+    def test_scalar_root_round_trip(self):
+        for data in (b'"str"', b'1', b'null', b'true'):
+            for output_format in ("json", "yaml", "jsonl"):
+                with self.subTest(data=data, output_format=output_format):
+                    output = convert(data, input_format="json", output_format=output_format).output
+                    self.assertEqual(json.loads(convert(output, input_format=output_format, output_format="json").output),
+                                     json.loads(data) if output_format != "jsonl" else [json.loads(data)])
+
+class JsonLinesFallbackTest(unittest.TestCase):
+    def test_unstreamable_input_falls_back_to_document_mode(self):
+        cases = (
+            ("xml", b"<root><x>1</x><y/><x>2</x></root>", b'{"x": ["1", "2"]}\n{"y": {}}\n'),
+            ("json", b'"str"', b'"str"\n'),
+        )
+        for input_format, data, expected in cases:
+            self.assertEqual(convert(data, input_format=input_format, output_format="jsonl").output, expected)
+            with self.assertRaises(ValueError):
+                convert(data, input_format=input_format, output_format="jsonl", stream=True)
+
+class ExpandInputPathsTest(unittest.TestCase):
+    def test_skips_output_dir_inside_input_tree(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            for name in ("a.json", os.path.join("sub", "b.json"), os.path.join("out", "a.yaml")):
+                os.makedirs(os.path.dirname(os.path.join(tmp, name)), exist_ok=True)
+                with open(os.path.join(tmp, name), 'w') as f:
+                    f.write("[]")
+            output_dir = os.path.join(tmp, "out")
+            expected = [os.path.join(tmp, "a.json"), os.path.join(tmp, "sub", "b.json")]
+            for pattern in (tmp, os.path.join(tmp, "**", "*.*")):
+                inputs = program.expand_input_paths([pattern], skip_dir=output_dir)
+                self.assertEqual(sorted(path for path, _ in inputs), expected)
+            inputs = program.expand_input_paths([os.path.join(output_dir, "*.yaml")], skip_dir=output_dir)
+            self.assertEqual([path for path, _ in inputs], [os.path.join(output_dir, "a.yaml")])
+
+class YamlStreamTest(unittest.TestCase):
+    def records(self, data):
+        return list(program._iter_yaml_records(io.BytesIO(data)))
+
+    def test_explicit_document_start_streams_sequence_items(self):
+        body = b"".join(b"- id: %d\n  name: Produkt %d\n" % (index, index) for index in range(50000))
+        for prefix in (b"", b"---\n", b"%YAML 1.1\n---\n", b"# komentarz\n--- \n"):
+            reader = CountingReader(prefix + body)
+            records = program._iter_yaml_records(reader)
+            self.assertEqual(next(records), (None, {"id": 0, "name": "Produkt 0"}))
+            self.assertLess(reader.consumed, len(body) // 4, prefix)
+            self.assertEqual(sum(1 for _ in records), 49999)
+
+    def test_explicit_document_start_matches_document_mode(self):
+        for data in (b"---\n- a: 1\n- [1, 2]\n", b"--- [1, {a: b}]\n", b"---\nkey: value\n"):
+            expected = convert(data, input_format="yaml", output_format="json").output
+            self.assertEqual(convert(data, input_format="yaml", output_format="json", stream=True).output, expected)
+
+    def test_multiple_documents_are_separate_records(self):
+        for data in (b"- a\n---\n- b\n", b"---\n- a\n---\n- b\n", b"a: 1\n---\n- b\n"):
+            self.assertEqual([value for _, value in self.records(data)][1:], [["b"]], data)
+
+    def test_large_sequence_followed_by_document_is_rejected(self):
+        data = b"".join(b"- %d\n" % index for index in range(50000)) + b"---\n- b\n"
+        with self.assertRaises(ValueError):
+            self.records(data)
+
+if __name__ == '__main__':
+    unittest.main()